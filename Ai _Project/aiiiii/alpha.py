@@ -1,73 +1,36 @@
-import tkinter as tk
-from tkinter import messagebox
-import time
-import matplotlib.pyplot as plt
-
-def create_board():
-    return [" " for _ in range(9)]
-
-def check_winner(board):
-    lines = [(0, 1, 2), (3, 4, 5), (6, 7, 8),
-             (0, 3, 6), (1, 4, 7), (2, 5, 8),
-             (0, 4, 8), (2, 4, 6)]
-
-    for line in lines:
-        if board[line[0]] == board[line[1]] == board[line[2]] != " ":
-            return True
-    return False
-
-def is_board_full(board):
-    return " " not in board
-
-def alpha_beta_pruning(board, depth, alpha, beta, is_maximizing):
-    if check_winner(board):
-        return -1 if is_maximizing else 1
-    elif is_board_full(board):
-        return 0
-
-    if is_maximizing:
-        max_eval = float('-inf')
-        for i in range(9):
-            if board[i] == " ":
-                board[i] = "O"
-                eval_score = alpha_beta_pruning(board, depth + 1, alpha, beta, False)
-                board[i] = " "
-                max_eval = max(max_eval, eval_score)
-                alpha = max(alpha, eval_score)
-                if beta <= alpha:
-                    break
-        return max_eval
-    else:
-        min_eval = float('inf')
-        for i in range(9):
-            if board[i] == " ":
-                board[i] = "X"
-                eval_score = alpha_beta_pruning(board, depth + 1, alpha, beta, True)
-                board[i] = " "
-                min_eval = min(min_eval, eval_score)
-                beta = min(beta, eval_score)
-                if beta <= alpha:
-                    break
-        return min_eval
+from engine import alphabeta
+from engine.board import check_winner, create_board, is_board_full
+from engine.deepening import iterative_deepening
+from engine.lookup import choose_move
+from engine.mnk import SearchLimit, get_geometry
+from engine.movetable import load_table
+from engine.mtdf import mtdf
+from engine.openingbook import load_book
+from engine.ordering import MoveOrdering
+from engine.transposition import TranspositionTable
+from engine.zobrist import ZobristHash
+
+def search(board, limit=None):
+    if use_deepening:
+        stop = None if limit is None else limit.stop
+        best_move, _, _, _ = iterative_deepening(board, get_geometry(3), seconds, stop=stop)
+        return best_move
+    if use_mtdf:
+        _, best_move, _ = mtdf(board, get_geometry(3), limit=limit)
+        return best_move
+    return alphabeta.find_best_move(board, transposition_table, ZobristHash(board, get_geometry(3)),
+                                    ordering=move_ordering, limit=limit)
 
 def make_ai_move():
-    start_time = time.time()
-    
-    best_score = float('-inf')
-    best_move = None
+    # Search a copy of the board on a worker thread; apply_ai_move runs back on the Tk thread
+    position = list(board)
+    # The move table covers every position, so it takes the tablebase's place
+    background.start(lambda stop: choose_move(position, search, opening_book, move_table, SearchLimit(stop=stop)),
+                     apply_ai_move)
 
-    for i in range(9):
-        if board[i] == " ":
-            board[i] = "O"
-            score = alpha_beta_pruning(board, 0, float('-inf'), float('inf'), False)
-            board[i] = " "
-            if score > best_score:
-                best_score = score
-                best_move = i
-
-    end_time = time.time()
-    execution_time = end_time - start_time
+def apply_ai_move(best_move, execution_time):
     execution_times.append(execution_time)
+    latency_plot.add(execution_time)
 
     if best_move is not None:
         board[best_move] = "O"
@@ -78,10 +41,10 @@ def make_ai_move():
         elif is_board_full(board):
             messagebox.showinfo("Tic Tac Toe", "It's a draw!")
             reset_game()
-        else:
-            update_plot()
 
 def on_click(row, col):
+    if background.busy:
+        return
     index = 3 * row + col
     if board[index] == " ":
         board[index] = "X"
@@ -97,30 +60,36 @@ def on_click(row, col):
 
 def reset_game():
     global board, execution_times
+    background.cancel()
     board = create_board()
     execution_times = []
+    latency_plot.reset()
     for button in buttons:
         button.config(text=" ", state=tk.NORMAL)
 
 def reset_game_button():
     reset_game()
 
-def update_plot():
-    cumulative_time = [sum(execution_times[:i + 1]) for i in range(len(execution_times))]
-    plt.clf()  # Clear the previous plot
-    plt.plot(range(1, len(cumulative_time) + 1), cumulative_time, marker='o')
-    plt.title('Step-by-Step Time Complexity')
-    plt.xlabel('Move Number')
-    plt.ylabel('Cumulative Time (seconds)')
-    plt.pause(0.1)  # Pause to allow the plot to update
-
 def run():
     window.after(100, make_ai_move)  # Use after to schedule the first AI move after a short delay
     window.mainloop()
 
 if __name__ == "__main__":
+    # GUI modules are only imported when the front-end starts
+    import tkinter as tk
+    from tkinter import messagebox
+    from background import BackgroundSearch
+    from latency_plot import LatencyPlot
+
     board = create_board()
     execution_times = []
+    transposition_table = TranspositionTable(size=8192, replacement="depth")
+    move_ordering = MoveOrdering(get_geometry(3))  # killers and history carry over from move to move
+    move_table = load_table()  # generate with: python -m engine.movetable
+    opening_book = load_book()  # generate with: python -m engine.openingbook
+    use_mtdf = False  # pick moves with MTD(f) instead of the root loop
+    use_deepening = False  # pick moves with iterative deepening, see python -m engine.deepening
+    seconds = 1.0  # time per move for iterative deepening; the deepest finished search is played
 
     window = tk.Tk()
     window.title("Tic Tac Toe")
@@ -138,8 +107,9 @@ if __name__ == "__main__":
 
     reset_button = tk.Button(window, text="Reset", command=reset_game_button)
     reset_button.grid(row=3, columnspan=3, pady=10)
+    thinking_label = tk.Label(window, text="")
+    thinking_label.grid(row=4, columnspan=3)
+    background = BackgroundSearch(window, thinking_label)
+    latency_plot = LatencyPlot(window, cumulative=True)
 
     run()
-
-    # Plot cumulative time complexity
-    plt.show()
@@ -0,0 +1,87 @@
+import queue
+import threading
+import time
+import traceback
+
+from engine.mnk import SearchAborted
+
+POLL_MS = 20
+
+class BackgroundSearch:
+    # Runs an engine search on a worker thread and hands the result back to
+    # the Tk thread with window.after, so the window keeps responding.
+    # Tk widgets are only ever touched from the Tk thread.
+    def __init__(self, window, indicator=None, text="Thinking...", on_error=None):
+        self.window = window
+        self.indicator = indicator
+        self.text = text
+        self.on_error = on_error if on_error is not None else self.report  # on_error(exception) on the Tk thread
+        self.results = queue.Queue()
+        self.generation = 0
+        self.busy = False
+        self.polling = False
+        self.stop = threading.Event()  # of the running search
+
+    def start(self, search, on_done):
+        # search(stop) runs on the worker thread; on_done(result, seconds) runs
+        # on the Tk thread. stop is a threading.Event that cancel() sets; give
+        # it to the engine's SearchLimit so the search raises SearchAborted
+        # instead of running on in the background.
+        self.stop.set()
+        self.stop = threading.Event()
+        self.generation += 1
+        self.busy = True
+        if self.indicator is not None:
+            self.indicator.config(text=self.text)
+        threading.Thread(target=self.run, args=(self.generation, search, on_done, self.stop), daemon=True).start()
+        if not self.polling:
+            self.polling = True
+            self.window.after(POLL_MS, self.poll)
+
+    def run(self, generation, search, on_done, stop):
+        # An exception is handed to the Tk thread too, otherwise the search
+        # would stay busy forever and the game would stop taking clicks
+        start_time = time.perf_counter()
+        try:
+            result, error = search(stop), None
+        except SearchAborted:
+            return  # cancelled, nobody is waiting for the result
+        except Exception as exception:
+            result, error = None, exception
+        self.results.put((generation, on_done, result, error, time.perf_counter() - start_time))
+
+    def poll(self):
+        while True:
+            try:
+                generation, on_done, result, error, seconds = self.results.get_nowait()
+            except queue.Empty:
+                break
+            # Results of cancelled searches are dropped
+            if generation == self.generation and self.busy:
+                self.finish()
+                if error is not None:
+                    self.on_error(error)
+                else:
+                    on_done(result, seconds)
+        if self.busy:
+            self.window.after(POLL_MS, self.poll)
+        else:
+            self.polling = False
+
+    def finish(self):
+        self.busy = False
+        if self.indicator is not None:
+            self.indicator.config(text="")
+
+    def report(self, error):
+        from tkinter import messagebox
+
+        traceback.print_exception(type(error), error, error.__traceback__)
+        messagebox.showerror("Tic Tac Toe", f"The AI search failed: {error}")
+
+    def cancel(self):
+        # The search stops at its next limit check; anything it still posts is ignored
+        if self.busy:
+            self.stop.set()
+            self.generation += 1
+            self.finish()
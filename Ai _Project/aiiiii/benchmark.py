@@ -0,0 +1,206 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+from engine import alphabeta, bitboard, minimax, mnk, symmetry
+from engine.instrumentation import SearchMetrics
+from engine.mtdf import mtdf
+from engine.ordering import MoveOrdering
+from engine.positions import corpus
+from engine.pvs import principal_variation_search
+from engine.transposition import TranspositionTable
+from engine.zobrist import SymmetricZobristHash, ZobristHash
+
+GEOMETRY = mnk.get_geometry(3)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+node_counts = {}  # (search, position, is_maximizing) -> bitboard tree size, see count_bitboard_nodes
+
+def count_bitboard_nodes(positions):
+    # The bitboard engines are timed without metrics, so their node counts
+    # are taken separately, before any timed run
+    for _, board, is_maximizing in positions:
+        position = bitboard.from_list(board)
+        if ("minimax", position, is_maximizing) not in node_counts:
+            node_counts[("minimax", position, is_maximizing)] = bitboard.count_nodes(position, is_maximizing)
+            metrics = SearchMetrics()
+            bitboard.alpha_beta_pruning(position, 0, float('-inf'), float('inf'), is_maximizing, metrics)
+            node_counts[("alpha-beta", position, is_maximizing)] = metrics.nodes
+
+# Each engine searches one position and returns the number of nodes it
+# visited, or None when the engine does not count nodes
+def bitboard_minimax(board, is_maximizing):
+    position = bitboard.from_list(board)
+    bitboard.minimax(position, 0, is_maximizing)
+    return node_counts[("minimax", position, is_maximizing)]
+
+def bitboard_alpha_beta(board, is_maximizing):
+    position = bitboard.from_list(board)
+    bitboard.alpha_beta_pruning(position, 0, float('-inf'), float('inf'), is_maximizing)
+    return node_counts[("alpha-beta", position, is_maximizing)]
+
+def alpha_beta(board, is_maximizing, ordering=None):
+    limit = mnk.SearchLimit()
+    mnk.alpha_beta_pruning(board, 0, float('-inf'), float('inf'), is_maximizing, GEOMETRY, limit, ordering)
+    return limit.nodes
+
+def alpha_beta_ordered(board, is_maximizing):
+    return alpha_beta(board, is_maximizing, MoveOrdering(GEOMETRY))
+
+def pvs_ordered(board, is_maximizing):
+    limit = mnk.SearchLimit()
+    principal_variation_search(board, 0, float('-inf'), float('inf'), is_maximizing, GEOMETRY, limit,
+                               MoveOrdering(GEOMETRY))
+    return limit.nodes
+
+def mtdf_ordered(board, is_maximizing):
+    limit = mnk.SearchLimit()
+    mtdf(board, GEOMETRY, is_maximizing=is_maximizing, limit=limit, ordering=MoveOrdering(GEOMETRY))
+    return limit.nodes
+
+# The find_best_move engines are the ones the game scripts play with. They
+# move for "O", so on an X-to-move position the colours are swapped first
+def o_to_move(board, is_maximizing):
+    if is_maximizing:
+        return board
+    return [{"X": "O", "O": "X"}.get(cell, cell) for cell in board]
+
+def alpha_beta_table(board, is_maximizing):
+    board = o_to_move(board, is_maximizing)
+    limit = mnk.SearchLimit()
+    alphabeta.find_best_move(board, TranspositionTable(size=8192, replacement="depth"),
+                             ZobristHash(board, GEOMETRY), limit=limit)
+    return limit.nodes
+
+def minimax_play(board, is_maximizing):
+    limit = mnk.SearchLimit()
+    minimax.find_best_move(o_to_move(board, is_maximizing), limit=limit)
+    return limit.nodes
+
+def symmetry_play(board, is_maximizing):
+    board = o_to_move(board, is_maximizing)
+    limit = mnk.SearchLimit()
+    symmetry.find_best_move(board, {}, SymmetricZobristHash(board, GEOMETRY), limit=limit)
+    return limit.nodes
+
+ENGINES = [
+    ("bitboard minimax", bitboard_minimax),
+    ("bitboard alpha-beta", bitboard_alpha_beta),
+    ("alpha-beta", alpha_beta),
+    ("alpha-beta +ordering", alpha_beta_ordered),
+    ("pvs +ordering", pvs_ordered),
+    ("mtdf +ordering", mtdf_ordered),
+    ("alpha-beta play +tt", alpha_beta_table),
+    ("minimax play", minimax_play),
+    ("symmetry play", symmetry_play),
+]
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+def time_engine(search, positions, warmup, repeat):
+    # Per position: warmup runs, then the median of repeat timed runs
+    rows = []
+    for name, board, is_maximizing in positions:
+        for _ in range(warmup):
+            search(list(board), is_maximizing)
+        times = []
+        for _ in range(repeat):
+            position = list(board)
+            start = time.perf_counter_ns()
+            nodes = search(position, is_maximizing)
+            times.append(time.perf_counter_ns() - start)
+        rows.append({"position": name, "median_ns": percentile(times, 0.5),
+                     "min_ns": min(times), "nodes": nodes})
+    return rows
+
+def summarize(rows):
+    times = [row["median_ns"] for row in rows]
+    total_ns = sum(times)
+    nodes = None if rows[0]["nodes"] is None else sum(row["nodes"] for row in rows)
+    return {"positions": len(rows), "total_ns": total_ns,
+            "p50_ns": percentile(times, 0.5), "p90_ns": percentile(times, 0.9),
+            "p99_ns": percentile(times, 0.99), "max_ns": max(times), "nodes": nodes,
+            "nodes_per_sec": None if nodes is None else nodes / (total_ns / 1e9)}
+
+def run(engines=ENGINES, warmup=1, repeat=5):
+    positions = corpus()
+    if any(search in (bitboard_minimax, bitboard_alpha_beta) for _, search in engines):
+        count_bitboard_nodes(positions)
+    results = {}
+    for name, search in engines:
+        rows = time_engine(search, positions, warmup, repeat)
+        results[name] = {"summary": summarize(rows), "positions": rows}
+    return results
+
+def write_results(results, prefix):
+    with open(prefix + ".json", "w") as f:
+        json.dump(results, f, indent=2)
+    with open(prefix + ".csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["engine", "position", "median_ns", "min_ns", "nodes"])
+        for engine, result in results.items():
+            for row in result["positions"]:
+                writer.writerow([engine, row["position"], row["median_ns"], row["min_ns"], row["nodes"]])
+
+def compare(results, baseline, tolerance):
+    # Returns the engines whose total time regressed by more than tolerance
+    regressions = []
+    for engine, result in results.items():
+        if engine not in baseline:
+            continue
+        before = baseline[engine]["summary"]["total_ns"]
+        after = result["summary"]["total_ns"]
+        if after > before * (1 + tolerance):
+            regressions.append((engine, before, after))
+    return regressions
+
+def print_results(results):
+    print(f"{'engine':<24}{'total ms':>10}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'nodes/sec':>14}")
+    for engine, result in results.items():
+        s = result["summary"]
+        nps = "-" if s["nodes_per_sec"] is None else f"{s['nodes_per_sec']:,.0f}"
+        print(f"{engine:<24}{s['total_ns'] / 1e6:>10.1f}{s['p50_ns'] / 1e6:>10.3f}"
+              f"{s['p90_ns'] / 1e6:>10.3f}{s['p99_ns'] / 1e6:>10.3f}{nps:>14}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time every engine on the fixed position corpus")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--engine", action="append", help="only run engines with this name")
+    parser.add_argument("--output", default="benchmark_results", help="prefix for the .json and .csv files")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("--allow-missing-baseline", action="store_true",
+                        help="exit 0 when there is no baseline to compare against")
+    args = parser.parse_args(argv)
+
+    engines = [(name, search) for name, search in ENGINES if not args.engine or name in args.engine]
+    results = run(engines, args.warmup, args.repeat)
+    print_results(results)
+    write_results(results, args.output)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        # Without a baseline nothing was checked, so this is not a pass
+        print(f"No baseline at {args.baseline}, run with --save-baseline to create one")
+        return 0 if args.allow_missing_baseline else 1
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    for engine, before, after in regressions:
+        print(f"REGRESSION {engine}: {before / 1e6:.1f} ms -> {after / 1e6:.1f} ms "
+              f"({after / before - 1:+.0%})")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2 @@
+# Search code shared by the game scripts. Nothing here imports tkinter or
+# matplotlib, and submodules are only loaded when they are imported.
@@ -0,0 +1,128 @@
+import time
+
+from . import mnk
+from .board import GEOMETRY, is_board_full
+from .transposition import EXACT, LOWER_BOUND, UPPER_BOUND
+
+def alpha_beta_pruning(board, depth, alpha, beta, is_maximizing, table=None, zobrist=None, metrics=None,
+                       ordering=None, limit=None, geometry=GEOMETRY):
+    # With zobrist (a zobrist.ZobristHash of board) the table is keyed on its
+    # incrementally updated key instead of a string built from the board.
+    # ordering (an ordering.MoveOrdering for geometry) picks the move order and
+    # learns from cutoffs; without it squares are tried in index order.
+    # geometry defaults to 3x3; mtdf passes its own with a zero window
+    if limit is not None:
+        limit.tick()
+    if metrics is not None:
+        metrics.node(depth)
+    if mnk.check_winner(board, geometry):
+        if metrics is not None:
+            metrics.terminal()
+        return -1 if is_maximizing else 1
+    elif is_board_full(board):
+        if metrics is not None:
+            metrics.terminal()
+        return 0
+
+    if table is not None:
+        if zobrist is not None:
+            key = zobrist.node_key(is_maximizing)
+            draft = zobrist.empty
+        else:
+            key = ("O" if is_maximizing else "X") + "".join(board)
+            draft = board.count(" ")
+        entry = table.lookup(key, draft)
+        if metrics is not None:
+            metrics.cache(entry is not None)
+        if entry is not None:
+            value, flag = entry
+            if flag == EXACT:
+                return value
+            elif flag == LOWER_BOUND:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if beta <= alpha:
+                return value
+        alpha_orig, beta_orig = alpha, beta
+
+    if ordering is not None:
+        moves = ordering.order(board, depth)
+    else:
+        moves = [i for i in range(geometry.size) if board[i] == " "]
+
+    if is_maximizing:
+        max_eval = float('-inf')
+        for move_number, i in enumerate(moves):
+            board[i] = "O"
+            if zobrist is not None:
+                zobrist.make(i, "O")
+            eval_score = alpha_beta_pruning(board, depth + 1, alpha, beta, False, table, zobrist, metrics, ordering,
+                                            limit, geometry)
+            board[i] = " "
+            if zobrist is not None:
+                zobrist.unmake(i, "O")
+            max_eval = max(max_eval, eval_score)
+            alpha = max(alpha, eval_score)
+            if beta <= alpha:
+                if ordering is not None:
+                    ordering.record_cutoff(i, depth, board.count(" "), move_number == 0)
+                if metrics is not None:
+                    metrics.cutoff()
+                break
+        best_eval = max_eval
+    else:
+        min_eval = float('inf')
+        for move_number, i in enumerate(moves):
+            board[i] = "X"
+            if zobrist is not None:
+                zobrist.make(i, "X")
+            eval_score = alpha_beta_pruning(board, depth + 1, alpha, beta, True, table, zobrist, metrics, ordering,
+                                            limit, geometry)
+            board[i] = " "
+            if zobrist is not None:
+                zobrist.unmake(i, "X")
+            min_eval = min(min_eval, eval_score)
+            beta = min(beta, eval_score)
+            if beta <= alpha:
+                if ordering is not None:
+                    ordering.record_cutoff(i, depth, board.count(" "), move_number == 0)
+                if metrics is not None:
+                    metrics.cutoff()
+                break
+        best_eval = min_eval
+
+    if table is not None:
+        if best_eval <= alpha_orig:
+            flag = UPPER_BOUND
+        elif best_eval >= beta_orig:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        table.store(key, best_eval, flag, draft)
+    return best_eval
+
+def find_best_move(board, table=None, zobrist=None, metrics=None, ordering=None, limit=None):
+    # Best square for "O", trying every empty square in index order; each
+    # gets a full window, so ordering only matters below the root
+    if metrics is not None:
+        metrics.searches += 1
+    best_score = float('-inf')
+    best_move = None
+    for i in range(9):
+        if board[i] == " ":
+            start_time = time.perf_counter()
+            board[i] = "O"
+            if zobrist is not None:
+                zobrist.make(i, "O")
+            score = alpha_beta_pruning(board, 1, float('-inf'), float('inf'), False, table, zobrist, metrics,
+                                       ordering, limit)
+            board[i] = " "
+            if zobrist is not None:
+                zobrist.unmake(i, "O")
+            if metrics is not None:
+                metrics.root_move(i, time.perf_counter() - start_time)
+            if score > best_score:
+                best_score = score
+                best_move = i
+    return best_move
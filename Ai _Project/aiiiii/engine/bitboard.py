@@ -0,0 +1,175 @@
+import time
+
+# Board is a tuple (x, o) of 9-bit integers, bit i set when square i is taken
+FULL = 0x1FF
+SQUARES = [1 << i for i in range(9)]
+
+WIN_MASKS = [sum(1 << i for i in line) for line in
+             [(0, 1, 2), (3, 4, 5), (6, 7, 8),
+              (0, 3, 6), (1, 4, 7), (2, 5, 8),
+              (0, 4, 8), (2, 4, 6)]]
+
+# WIN_TABLE[bits] is True when bits contain a complete line
+WIN_TABLE = [any(bits & mask == mask for mask in WIN_MASKS) for bits in range(512)]
+
+# EMPTY_SQUARES[occupied] lists (index, bit) for every empty square, in index order
+EMPTY_SQUARES = [[(i, 1 << i) for i in range(9) if not occupied & (1 << i)]
+                 for occupied in range(512)]
+
+def create_board():
+    return (0, 0)
+
+def check_winner(board):
+    return WIN_TABLE[board[0]] or WIN_TABLE[board[1]]
+
+def is_board_full(board):
+    return board[0] | board[1] == FULL
+
+def from_list(board):
+    x = sum(1 << i for i in range(9) if board[i] == "X")
+    o = sum(1 << i for i in range(9) if board[i] == "O")
+    return (x, o)
+
+def to_list(board):
+    return ["X" if board[0] & bit else "O" if board[1] & bit else " " for bit in SQUARES]
+
+def make_move(board, index, player):
+    if player == "X":
+        return (board[0] | SQUARES[index], board[1])
+    return (board[0], board[1] | SQUARES[index])
+
+def minimax(board, depth, is_maximizing, metrics=None):
+    x, o = board
+    if metrics is not None:
+        metrics.node(depth)
+    if WIN_TABLE[x] or WIN_TABLE[o]:
+        if metrics is not None:
+            metrics.terminal()
+        return -1 if is_maximizing else 1
+    occupied = x | o
+    if occupied == FULL:
+        if metrics is not None:
+            metrics.terminal()
+        return 0
+
+    if is_maximizing:
+        max_eval = float('-inf')
+        for _, bit in EMPTY_SQUARES[occupied]:
+            max_eval = max(max_eval, minimax((x, o | bit), depth + 1, False, metrics))
+        return max_eval
+    else:
+        min_eval = float('inf')
+        for _, bit in EMPTY_SQUARES[occupied]:
+            min_eval = min(min_eval, minimax((x | bit, o), depth + 1, True, metrics))
+        return min_eval
+
+def alpha_beta_pruning(board, depth, alpha, beta, is_maximizing, metrics=None):
+    x, o = board
+    if metrics is not None:
+        metrics.node(depth)
+    if WIN_TABLE[x] or WIN_TABLE[o]:
+        if metrics is not None:
+            metrics.terminal()
+        return -1 if is_maximizing else 1
+    occupied = x | o
+    if occupied == FULL:
+        if metrics is not None:
+            metrics.terminal()
+        return 0
+
+    if is_maximizing:
+        max_eval = float('-inf')
+        for _, bit in EMPTY_SQUARES[occupied]:
+            eval_score = alpha_beta_pruning((x, o | bit), depth + 1, alpha, beta, False, metrics)
+            max_eval = max(max_eval, eval_score)
+            alpha = max(alpha, eval_score)
+            if beta <= alpha:
+                if metrics is not None:
+                    metrics.cutoff()
+                break
+        return max_eval
+    else:
+        min_eval = float('inf')
+        for _, bit in EMPTY_SQUARES[occupied]:
+            eval_score = alpha_beta_pruning((x | bit, o), depth + 1, alpha, beta, True, metrics)
+            min_eval = min(min_eval, eval_score)
+            beta = min(beta, eval_score)
+            if beta <= alpha:
+                if metrics is not None:
+                    metrics.cutoff()
+                break
+        return min_eval
+
+def best_move(board, use_alpha_beta=True, metrics=None):
+    # Best square for "O" to play, searched the same way as make_ai_move
+    x, o = board
+    if metrics is not None:
+        metrics.searches += 1
+    best_score = float('-inf')
+    best_index = None
+    for i, bit in EMPTY_SQUARES[x | o]:
+        start_time = time.perf_counter()
+        if use_alpha_beta:
+            score = alpha_beta_pruning((x, o | bit), 1, float('-inf'), float('inf'), False, metrics)
+        else:
+            score = minimax((x, o | bit), 1, False, metrics)
+        if metrics is not None:
+            metrics.root_move(i, time.perf_counter() - start_time)
+        if score > best_score:
+            best_score = score
+            best_index = i
+    return best_index
+
+# Reference list-of-strings search, identical to the one in the game scripts
+def list_check_winner(board):
+    lines = [(0, 1, 2), (3, 4, 5), (6, 7, 8),
+             (0, 3, 6), (1, 4, 7), (2, 5, 8),
+             (0, 4, 8), (2, 4, 6)]
+
+    for line in lines:
+        if board[line[0]] == board[line[1]] == board[line[2]] != " ":
+            return True
+    return False
+
+def list_minimax(board, depth, is_maximizing):
+    if list_check_winner(board):
+        return -1 if is_maximizing else 1
+    elif " " not in board:
+        return 0
+
+    scores = []
+    for i in range(9):
+        if board[i] == " ":
+            board[i] = "O" if is_maximizing else "X"
+            score = list_minimax(board, depth + 1, not is_maximizing)
+            board[i] = " "
+            scores.append(score)
+
+    return max(scores) if is_maximizing else min(scores)
+
+def count_nodes(board, is_maximizing):
+    x, o = board
+    if WIN_TABLE[x] or WIN_TABLE[o] or x | o == FULL:
+        return 1
+    count = 1
+    for _, bit in EMPTY_SQUARES[x | o]:
+        child = (x, o | bit) if is_maximizing else (x | bit, o)
+        count += count_nodes(child, not is_maximizing)
+    return count
+
+def benchmark(repeat=3):
+    nodes = count_nodes(create_board(), True)
+    results = {}
+    for name, search, board in [("list", list_minimax, [" " for _ in range(9)]),
+                                ("bitboard", minimax, create_board())]:
+        best = float('inf')
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            search(board, 0, True)
+            best = min(best, time.perf_counter() - start_time)
+        results[name] = nodes / best
+        print(f"{name:>8}: {nodes} nodes in {best:.3f}s, {nodes / best:,.0f} nodes/sec")
+    print(f"speedup: {results['bitboard'] / results['list']:.2f}x")
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,26 @@
+import random
+
+from .board import check_winner
+
+def strategic_blocking(board, rng=random):
+    # Check if there's a move to block the player from winning
+    for i in range(9):
+        if board[i] == " ":
+            board[i] = "X"
+            if check_winner(board):
+                board[i] = " "
+                return i
+            board[i] = " "
+
+    # If no blocking move, return a random move
+    return rng.choice([i for i in range(9) if board[i] == " "])
+
+def medium_move(board, rng=random):
+    # Medium-level AI: Combining random moves and strategic blocking
+    available_spots = [i for i in range(9) if board[i] == " "]
+    if not available_spots:
+        return None
+    # Random move with 60% probability
+    if rng.random() < 0.6:
+        return rng.choice(available_spots)
+    return strategic_blocking(board, rng)
@@ -0,0 +1,14 @@
+# The 3x3 list board used by the game scripts: nine cells of " ", "X" or "O".
+# These are the mnk functions with the 3x3 geometry filled in.
+from . import mnk
+
+GEOMETRY = mnk.get_geometry(3)
+LINES = GEOMETRY.lines
+
+def create_board():
+    return mnk.create_board(3)
+
+def check_winner(board):
+    return mnk.check_winner(board, GEOMETRY)
+
+is_board_full = mnk.is_board_full
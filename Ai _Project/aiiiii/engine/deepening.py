@@ -0,0 +1,113 @@
+import sys
+import time
+
+from .mnk import WIN_SCORE, SearchAborted, SearchLimit, check_winner, create_board, get_geometry, is_board_full
+
+def no_evaluation(board, geometry):
+    return 0
+
+def ordered_moves(board, geometry, first=None):
+    moves = [i for i in range(geometry.size) if board[i] == " "]
+    if first is not None and first in moves:
+        moves.remove(first)
+        moves.insert(0, first)
+    return moves
+
+def depth_limited_search(board, depth, max_depth, alpha, beta, is_maximizing, geometry,
+                         limit, evaluate, pv, ordering=None, metrics=None):
+    # Returns (score, line); pv is the previous iteration's line from this node, tried first
+    limit.tick()
+    if metrics is not None:
+        metrics.node(depth)
+    if check_winner(board, geometry):
+        if metrics is not None:
+            metrics.terminal()
+        return (-WIN_SCORE if is_maximizing else WIN_SCORE), []
+    elif is_board_full(board):
+        if metrics is not None:
+            metrics.terminal()
+        return 0, []
+    elif depth >= max_depth:
+        return evaluate(board, geometry), []
+
+    best_eval = float('-inf') if is_maximizing else float('inf')
+    best_line = []
+    first = pv[0] if pv else None
+    if ordering is not None:
+        moves = ordering.order(board, depth, first)
+    else:
+        moves = ordered_moves(board, geometry, first)
+    for move_number, i in enumerate(moves):
+        child_pv = pv[1:] if pv and pv[0] == i else []
+        start_time = time.perf_counter()
+        board[i] = "O" if is_maximizing else "X"
+        try:
+            eval_score, line = depth_limited_search(board, depth + 1, max_depth, alpha, beta,
+                                                    not is_maximizing, geometry, limit, evaluate, child_pv,
+                                                    ordering, metrics)
+        finally:
+            board[i] = " "
+        if metrics is not None and depth == 0:
+            metrics.root_move(i, time.perf_counter() - start_time)
+        if is_maximizing and eval_score > best_eval:
+            best_eval, best_line = eval_score, [i] + line
+            alpha = max(alpha, eval_score)
+        elif not is_maximizing and eval_score < best_eval:
+            best_eval, best_line = eval_score, [i] + line
+            beta = min(beta, eval_score)
+        if beta <= alpha:
+            if ordering is not None:
+                ordering.record_cutoff(i, depth, max_depth - depth, move_number == 0)
+            if metrics is not None:
+                metrics.cutoff()
+            break
+    return best_eval, best_line
+
+def iterative_deepening(board, geometry, seconds=1.0, evaluate=no_evaluation, max_depth=None,
+                        is_maximizing=True, ordering=None, metrics=None, stop=None):
+    # Searches depth 1, 2, 3... until the time budget runs out, or the stop
+    # event is set, and returns (best move, score, deepest completed depth,
+    # principal variation)
+    limit = SearchLimit(seconds=seconds, stop=stop)
+    empty = board.count(" ")
+    if max_depth is None or max_depth > empty:
+        max_depth = empty
+
+    moves = ordered_moves(board, geometry)
+    if not moves or check_winner(board, geometry):
+        return None, None, 0, []
+    if metrics is not None:
+        metrics.searches += 1
+    best_move = moves[0]
+    best_score, completed_depth, best_line = None, 0, []
+    for depth in range(1, max_depth + 1):
+        try:
+            score, line = depth_limited_search(board, 0, depth, float('-inf'), float('inf'),
+                                               is_maximizing, geometry, limit, evaluate, best_line,
+                                               ordering, metrics)
+        except SearchAborted:
+            break
+        best_move, best_score, completed_depth, best_line = line[0], score, depth, line
+        if abs(score) >= WIN_SCORE:
+            break
+    return best_move, best_score, completed_depth, best_line
+
+def depth_limited_move(board, max_depth, evaluate=no_evaluation, geometry=None, is_maximizing=True, limit=None):
+    # Single search to max_depth plies with leaves scored by evaluate; returns (best move, score)
+    if geometry is None:
+        geometry = get_geometry(3)
+    if limit is None:
+        limit = SearchLimit()
+    if check_winner(board, geometry) or is_board_full(board):
+        return None, None
+    score, line = depth_limited_search(list(board), 0, max_depth, float('-inf'), float('inf'), is_maximizing,
+                                       geometry, limit, evaluate, [])
+    return line[0], score
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    for n, k in [(3, 3), (4, 4), (5, 4), (7, 5)]:
+        start_time = time.perf_counter()
+        move, score, depth, line = iterative_deepening(create_board(n), get_geometry(n, k), seconds)
+        elapsed = time.perf_counter() - start_time
+        print(f"{n}x{n} k={k}: move {move}, score {score}, depth {depth}, {elapsed:.3f}s, line {line}")
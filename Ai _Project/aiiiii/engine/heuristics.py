@@ -0,0 +1,130 @@
+import sys
+
+from . import bitboard
+from .board import LINES
+from .deepening import depth_limited_move, no_evaluation
+from .mnk import SearchLimit, check_winner, get_geometry, is_board_full
+from .positions import corpus
+
+def center_squares(geometry=None):
+    # The middle square, or the middle 2x2 block on even boards
+    if geometry is None:
+        return [4]
+    n = geometry.n
+    middle = [n // 2] if n % 2 else [n // 2 - 1, n // 2]
+    return [row * n + col for row in middle for col in middle]
+
+def center_occupancy_heuristic(board, player, geometry=None):
+    center_score = 0
+    for center_index in center_squares(geometry):
+        if board[center_index] == player:
+            center_score += 2
+    return center_score
+
+def winning_move_or_block_opponent_heuristic(board, player, geometry=None):
+    lines = LINES if geometry is None else geometry.lines
+    score = 0
+
+    for line in lines:
+        line_values = [board[i] for i in line]
+        count_player = line_values.count(player)
+        count_opponent = line_values.count("X" if player == "O" else "O")
+
+        if count_player == len(line) - 1 and count_opponent == 0:
+            # One move from completing the line for the player, prioritize this move
+            score += 10
+        elif count_opponent == len(line) - 1 and count_player == 0:
+            # One move from completing the line for the opponent, prioritize blocking
+            score += 5
+
+    return score
+
+# Leaf evaluations for depth-limited search: evaluate(board, geometry) scores
+# the position for "O", well inside +-WIN_SCORE
+def center_occupancy_evaluation(board, geometry):
+    return (center_occupancy_heuristic(board, "O", geometry)
+            - center_occupancy_heuristic(board, "X", geometry))
+
+def winning_move_or_block_evaluation(board, geometry):
+    return (winning_move_or_block_opponent_heuristic(board, "O", geometry)
+            - winning_move_or_block_opponent_heuristic(board, "X", geometry))
+
+class WeightedEvaluation:
+    # Weighted sum of evaluations; a class rather than a closure so it can be
+    # sent to worker processes
+    def __init__(self, weights):
+        self.weights = weights  # list of (weight, evaluate)
+
+    def __call__(self, board, geometry):
+        return sum(weight * evaluate(board, geometry) for weight, evaluate in self.weights)
+
+EVALUATIONS = {
+    "none": no_evaluation,
+    "center": center_occupancy_evaluation,
+    "win/block": winning_move_or_block_evaluation,
+    "weighted": WeightedEvaluation([(1, center_occupancy_evaluation), (2, winning_move_or_block_evaluation)]),
+}
+
+def perfect_value(board, is_maximizing, values):
+    # Game-theoretic value for "O" (1, 0 or -1), memoized in values
+    key = ("O" if is_maximizing else "X") + "".join(board)
+    if key not in values:
+        values[key] = bitboard.alpha_beta_pruning(bitboard.from_list(board), 0, float('-inf'), float('inf'),
+                                                  is_maximizing)
+    return values[key]
+
+def perfect_move(board, is_maximizing, values):
+    moves = [i for i in range(9) if board[i] == " "]
+    player = "O" if is_maximizing else "X"
+    choose = max if is_maximizing else min
+    return choose(moves, key=lambda i: perfect_value(board[:i] + [player] + board[i + 1:], not is_maximizing, values))
+
+def play_against_perfect(max_depth, evaluate, limited_is_o, opening, values):
+    # X plays opening first, then the two engines alternate; returns the
+    # result for the depth-limited engine: 1 win, 0 draw, -1 loss
+    geometry = get_geometry(3)
+    board = [" "] * 9
+    board[opening] = "X"
+    is_maximizing = True  # "O" to move
+    while not check_winner(board, geometry) and not is_board_full(board):
+        if is_maximizing == limited_is_o:
+            move, _ = depth_limited_move(board, max_depth, evaluate, geometry, is_maximizing)
+        else:
+            move = perfect_move(board, is_maximizing, values)
+        board[move] = "O" if is_maximizing else "X"
+        is_maximizing = not is_maximizing
+    if not check_winner(board, geometry):
+        return 0
+    # The side that just moved won
+    return 1 if (not is_maximizing) == limited_is_o else -1
+
+def strength(depths=range(1, 10), evaluations=EVALUATIONS):
+    # For each evaluation and depth limit: nodes searched over the benchmark
+    # corpus, share of corpus moves that keep the game-theoretic value, and
+    # results against perfect play over every opening with the engine as O
+    # and as X
+    geometry = get_geometry(3)
+    positions = [(board, is_maximizing) for _, board, is_maximizing in corpus()]
+    values = {}
+    rows = []
+    for name, evaluate in evaluations.items():
+        for max_depth in depths:
+            limit = SearchLimit()
+            optimal = 0
+            for board, is_maximizing in positions:
+                move, _ = depth_limited_move(board, max_depth, evaluate, geometry, is_maximizing, limit)
+                player = "O" if is_maximizing else "X"
+                child = board[:move] + [player] + board[move + 1:]
+                if perfect_value(child, not is_maximizing, values) == perfect_value(board, is_maximizing, values):
+                    optimal += 1
+            results = [play_against_perfect(max_depth, evaluate, limited_is_o, opening, values)
+                       for limited_is_o in (True, False) for opening in range(9)]
+            rows.append((name, max_depth, limit.nodes, optimal / len(positions),
+                         results.count(1), results.count(0), results.count(-1)))
+    return rows
+
+if __name__ == "__main__":
+    depths = range(1, int(sys.argv[1]) + 1) if len(sys.argv) > 1 else range(1, 10)
+    print(f"{'evaluation':<12}{'depth':>6}{'nodes':>10}{'optimal':>9}{'W':>4}{'D':>4}{'L':>4}")
+    for name, max_depth, nodes, accuracy, wins, draws, losses in strength(depths):
+        print(f"{name:<12}{max_depth:>6}{nodes:>10,}{accuracy:>9.1%}{wins:>4}{draws:>4}{losses:>4}")
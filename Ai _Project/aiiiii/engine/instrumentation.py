@@ -0,0 +1,120 @@
+# Engines take metrics=None; when it is None they skip every counter update
+class SearchMetrics:
+    COUNTERS = [
+        ("nodes", "Nodes visited"),
+        ("terminal_hits", "Won, lost or drawn positions reached"),
+        ("cutoffs", "Alpha-beta cutoffs"),
+        ("cache_hits", "Transposition table hits"),
+        ("cache_misses", "Transposition table misses"),
+        ("searches", "Root searches started"),
+    ]
+
+    def __init__(self, engine="search"):
+        self.engine = engine
+        self.reset()
+
+    def reset(self):
+        self.nodes = 0
+        self.terminal_hits = 0
+        self.cutoffs = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.searches = 0
+        self.max_depth = 0
+        self.root_move_seconds = {}  # move -> total seconds spent below it
+        self.root_move_searches = {}
+
+    def node(self, depth):
+        self.nodes += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def terminal(self):
+        self.terminal_hits += 1
+
+    def cutoff(self):
+        self.cutoffs += 1
+
+    def cache(self, hit):
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+    def root_move(self, move, seconds):
+        self.root_move_seconds[move] = self.root_move_seconds.get(move, 0.0) + seconds
+        self.root_move_searches[move] = self.root_move_searches.get(move, 0) + 1
+
+    def merge(self, other):
+        # Adds the counts of other, e.g. one filled in by a worker process
+        for name, _ in self.COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.max_depth = max(self.max_depth, other.max_depth)
+        for move, seconds in other.root_move_seconds.items():
+            self.root_move_seconds[move] = self.root_move_seconds.get(move, 0.0) + seconds
+        for move, count in other.root_move_searches.items():
+            self.root_move_searches[move] = self.root_move_searches.get(move, 0) + count
+
+    def as_dict(self):
+        # Safe to call from another thread while a search is running
+        result = {name: getattr(self, name) for name, _ in self.COUNTERS}
+        result["engine"] = self.engine
+        result["max_depth"] = self.max_depth
+        result["root_move_seconds"] = {str(move): seconds for move, seconds in dict(self.root_move_seconds).items()}
+        result["root_move_searches"] = {str(move): count for move, count in dict(self.root_move_searches).items()}
+        return result
+
+    def to_json(self):
+        import json
+
+        return json.dumps(self.as_dict(), indent=2)
+
+def to_prometheus(metrics_list, prefix="tictactoe_search"):
+    # Prometheus text exposition format for one or more SearchMetrics
+    data = [metrics.as_dict() for metrics in metrics_list]
+    lines = []
+    for name, description in SearchMetrics.COUNTERS:
+        lines.append(f"# HELP {prefix}_{name}_total {description}")
+        lines.append(f"# TYPE {prefix}_{name}_total counter")
+        for d in data:
+            lines.append(f'{prefix}_{name}_total{{engine="{d["engine"]}"}} {d[name]}')
+    lines.append(f"# HELP {prefix}_max_depth Deepest ply reached")
+    lines.append(f"# TYPE {prefix}_max_depth gauge")
+    for d in data:
+        lines.append(f'{prefix}_max_depth{{engine="{d["engine"]}"}} {d["max_depth"]}')
+    lines.append(f"# HELP {prefix}_root_move_seconds_total Time spent searching each root move")
+    lines.append(f"# TYPE {prefix}_root_move_seconds_total counter")
+    for d in data:
+        for move, seconds in d["root_move_seconds"].items():
+            lines.append(f'{prefix}_root_move_seconds_total{{engine="{d["engine"]}",move="{move}"}} {seconds:.9f}')
+    return "\n".join(lines) + "\n"
+
+def serve_metrics(metrics_list, port=9100, host=""):
+    # Serves /metrics (Prometheus) and /metrics.json from a daemon thread.
+    # The exporter's modules are imported here so that the search modules,
+    # which only need SearchMetrics, stay cheap to import in worker processes
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body, content_type = to_prometheus(metrics_list), "text/plain; version=0.0.4"
+            elif self.path == "/metrics.json":
+                body = json.dumps([metrics.as_dict() for metrics in metrics_list], indent=2)
+                content_type = "application/json"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+        def log_message(self, format, *args):
+            pass
+
+    server = HTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
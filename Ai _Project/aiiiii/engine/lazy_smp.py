@@ -0,0 +1,269 @@
+import os
+import random
+import sys
+import time
+
+from . import mnk
+from .deepening import no_evaluation
+from .instrumentation import SearchMetrics
+from .mnk import WIN_SCORE, SearchAborted, SearchLimit, check_winner, is_board_full
+from .ordering import MoveOrdering
+from .transposition import EXACT, LOWER_BOUND, UPPER_BOUND
+from .zobrist import ZobristHash
+
+# Slot data, from the low bits: move (8 bits, NO_MOVE when there is none),
+# flag (2), draft (10), then value * VALUE_SCALE + VALUE_OFFSET
+NO_MOVE = 255
+VALUE_SCALE = 1 << 8  # scores are stored exactly in steps of 1/256
+VALUE_OFFSET = 1 << 32
+
+class SharedTable:
+    # Transposition table in shared memory. Each slot holds (key ^ data, data)
+    # so a slot torn by two concurrent writers fails the key check instead
+    # of returning the wrong entry.
+    def __init__(self, size=1 << 16, slots=None):
+        self.size = size
+        if slots is None:
+            import multiprocessing
+            slots = multiprocessing.RawArray("q", 2 * size)
+        self.slots = slots
+
+    def lookup(self, key):
+        # Returns (value, flag, draft, move) or None
+        index = 2 * (key % self.size)
+        data = self.slots[index + 1]
+        if data == 0 or self.slots[index] ^ data != key:
+            return None
+        move = data & 0xFF
+        value = (data >> 20) - VALUE_OFFSET
+        value = value // VALUE_SCALE if value % VALUE_SCALE == 0 else value / VALUE_SCALE
+        return value, (data >> 8) & 0x3, (data >> 10) & 0x3FF, None if move == NO_MOVE else move
+
+    def store(self, key, value, flag, draft, move):
+        # Depth-preferred: a deeper entry for another position is kept
+        index = 2 * (key % self.size)
+        old = self.slots[index + 1]
+        if old != 0 and self.slots[index] ^ old != key and (old >> 10) & 0x3FF > draft:
+            return
+        scaled = value * VALUE_SCALE
+        if scaled != int(scaled) or not -VALUE_OFFSET <= scaled < VALUE_OFFSET:
+            raise ValueError(f"SharedTable cannot store the score {value} exactly; "
+                             f"use multiples of 1/{VALUE_SCALE} below {VALUE_OFFSET // VALUE_SCALE}")
+        data = ((int(scaled) + VALUE_OFFSET) << 20) | (draft << 10) | (flag << 8) | \
+            (NO_MOVE if move is None else move)
+        self.slots[index] = key ^ data
+        self.slots[index + 1] = data
+
+    def clear(self):
+        import ctypes
+        ctypes.memset(ctypes.addressof(self.slots), 0, ctypes.sizeof(self.slots))
+
+class StopLimit(SearchLimit):
+    # Also aborts once another worker raises the shared stop flag
+    def __init__(self, stop, seconds=None):
+        super().__init__(seconds=seconds)
+        self.stop_flag = stop  # a shared multiprocessing.Value, not SearchLimit's threading.Event
+
+    def tick(self):
+        super().tick()
+        if self.nodes & 63 == 0 and self.stop_flag.value:
+            raise SearchAborted()
+
+table = None
+stop_flag = None
+
+def init_worker(slots, size, stop):
+    global table, stop_flag
+    table = SharedTable(size, slots)
+    stop_flag = stop
+
+def smp_search(board, depth, max_depth, alpha, beta, is_maximizing, geometry, limit, evaluate, ordering, zobrist,
+               metrics=None):
+    # zobrist is a ZobristHash of board; its seeded keys are the same in every process
+    limit.tick()
+    if metrics is not None:
+        metrics.node(depth)
+    if check_winner(board, geometry):
+        if metrics is not None:
+            metrics.terminal()
+        return -WIN_SCORE if is_maximizing else WIN_SCORE
+    elif is_board_full(board):
+        if metrics is not None:
+            metrics.terminal()
+        return 0
+    remaining = max_depth - depth
+    if remaining <= 0:
+        return evaluate(board, geometry)
+
+    key = zobrist.node_key(is_maximizing)
+    entry = table.lookup(key)
+    if metrics is not None:
+        metrics.cache(entry is not None)
+    hash_move = None
+    if entry is not None:
+        value, flag, draft, hash_move = entry
+        if draft >= remaining:
+            if flag == EXACT:
+                return value
+            elif flag == LOWER_BOUND:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if beta <= alpha:
+                return value
+    alpha_orig, beta_orig = alpha, beta
+
+    best_eval = float('-inf') if is_maximizing else float('inf')
+    best_move = None
+    player = "O" if is_maximizing else "X"
+    for move_number, i in enumerate(ordering.order(board, depth, hash_move)):
+        board[i] = player
+        zobrist.make(i, player)
+        try:
+            eval_score = smp_search(board, depth + 1, max_depth, alpha, beta, not is_maximizing,
+                                    geometry, limit, evaluate, ordering, zobrist, metrics)
+        finally:
+            board[i] = " "
+            zobrist.unmake(i, player)
+        if is_maximizing and eval_score > best_eval:
+            best_eval, best_move = eval_score, i
+            alpha = max(alpha, eval_score)
+        elif not is_maximizing and eval_score < best_eval:
+            best_eval, best_move = eval_score, i
+            beta = min(beta, eval_score)
+        if beta <= alpha:
+            ordering.record_cutoff(i, depth, remaining, move_number == 0)
+            if metrics is not None:
+                metrics.cutoff()
+            break
+
+    if best_eval <= alpha_orig:
+        flag = UPPER_BOUND
+    elif best_eval >= beta_orig:
+        flag = LOWER_BOUND
+    else:
+        flag = EXACT
+    table.store(key, best_eval, flag, remaining, best_move)
+    return best_eval
+
+def smp_worker(board, n, k, max_depth, seconds, evaluate, worker_id, metrics=None):
+    # Iterative deepening over the shared table; helpers (worker_id > 0)
+    # start one ply deeper on odd ids and try moves in a shuffled order.
+    # metrics is this worker's own SearchMetrics, sent back to the parent
+    geometry = mnk.get_geometry(n, k)
+    ordering = MoveOrdering(geometry)
+    if worker_id > 0:
+        random.Random(worker_id).shuffle(ordering.static_order)
+    limit = StopLimit(stop_flag, seconds)
+    board = list(board)
+    zobrist = ZobristHash(board, geometry)
+    result = (None, None, 0)
+    try:
+        for depth in range(1 + worker_id % 2, max_depth + 1):
+            best_score, best_move = float('-inf'), None
+            for i in ordering.order(board, 0, result[0]):
+                start_time = time.perf_counter()
+                board[i] = "O"
+                zobrist.make(i, "O")
+                try:
+                    score = smp_search(board, 1, depth, best_score, float('inf'), False, geometry, limit,
+                                       evaluate, ordering, zobrist, metrics)
+                finally:
+                    board[i] = " "
+                    zobrist.unmake(i, "O")
+                    if metrics is not None:
+                        metrics.root_move(i, time.perf_counter() - start_time)
+                if score > best_score:
+                    best_score, best_move = score, i
+            result = (best_move, best_score, depth)
+            if abs(best_score) >= WIN_SCORE:
+                break
+    except SearchAborted:
+        pass
+    if worker_id == 0:
+        stop_flag.value = 1
+    return result + (limit.nodes, metrics)
+
+class LazySMPSearch:
+    def __init__(self, workers=2, table_size=1 << 16):
+        self.workers = workers
+        self.table_size = table_size
+        # multiprocessing is only imported by the parent; workers just need smp_worker
+        import multiprocessing
+        self.slots = multiprocessing.RawArray("q", 2 * table_size)
+        self.stop = multiprocessing.Value("b", 0, lock=False)
+        self.executor = None
+
+    def best_move(self, board, geometry, max_depth=None, seconds=None, evaluate=no_evaluation, metrics=None):
+        # Returns (square, score for "O", completed depth, total nodes over all workers);
+        # metrics gets the counts of every worker added together
+        if geometry.size > NO_MOVE:
+            raise ValueError(f"lazy SMP stores moves in 8 bits, {geometry.n}x{geometry.n} has too many squares")
+        if max_depth is None or max_depth > board.count(" "):
+            max_depth = board.count(" ")
+        SharedTable(self.table_size, self.slots).clear()
+        self.stop.value = 0
+        if self.executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                                initargs=(self.slots, self.table_size, self.stop))
+        futures = [self.executor.submit(smp_worker, board, geometry.n, geometry.k, max_depth, seconds,
+                                        evaluate, worker_id, None if metrics is None else SearchMetrics(metrics.engine))
+                   for worker_id in range(self.workers)]
+        results = [future.result() for future in futures]
+        if metrics is not None:
+            metrics.searches += 1
+            for result in results:
+                metrics.merge(result[4])
+        move, score, depth, _, _ = results[0]
+        if move is None:
+            move = next(i for i in range(geometry.size) if board[i] == " ")
+        return move, score, depth, sum(result[3] for result in results)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def serial_best_move(board, geometry, max_depth, evaluate=no_evaluation, table_size=1 << 16):
+    # The same search as one worker, run in this process with no pool: the
+    # baseline the parallel times are compared against
+    import multiprocessing
+    init_worker(multiprocessing.RawArray("q", 2 * table_size), table_size, multiprocessing.Value("b", 0, lock=False))
+    move, score, depth, nodes, _ = smp_worker(board, geometry.n, geometry.k, max_depth, None, evaluate, 0)
+    return move, score, depth, nodes
+
+def scaling(n=5, k=4, depth=6, worker_counts=(1, 2, 4, 8), evaluate=None):
+    # Rows of (workers, move, score, completed depth, nodes, seconds); workers
+    # is "serial" for the in-process baseline. With no_evaluation almost every
+    # leaf scores 0 and alpha-beta prunes nearly everything, so the default
+    # is the weighted heuristic on a search that takes seconds serially.
+    if evaluate is None:
+        from .heuristics import EVALUATIONS
+        evaluate = EVALUATIONS["weighted"]
+    geometry = mnk.get_geometry(n, k)
+    rows = []
+    start_time = time.perf_counter()
+    result = serial_best_move(mnk.create_board(n), geometry, depth, evaluate)
+    rows.append(("serial",) + result + (time.perf_counter() - start_time,))
+    for workers in worker_counts:
+        with LazySMPSearch(workers) as search:
+            start_time = time.perf_counter()
+            result = search.best_move(mnk.create_board(n), geometry, max_depth=depth, evaluate=evaluate)
+            rows.append((workers,) + result + (time.perf_counter() - start_time,))
+    return rows
+
+if __name__ == "__main__":
+    n, k, depth = (int(arg) for arg in sys.argv[1:4]) if len(sys.argv) > 3 else (5, 4, 6)
+    rows = scaling(n, k, depth)
+    base = rows[0][5]
+    print(f"{n}x{n} k={k}, depth {depth}, weighted evaluation, {os.cpu_count()} cpus; speedup against serial")
+    print(f"{'workers':>8}{'move':>6}{'score':>7}{'depth':>7}{'nodes':>12}{'seconds':>10}{'speedup':>9}")
+    for workers, move, score, completed, nodes, elapsed in rows:
+        print(f"{workers:>8}{move:>6}{score:>7}{completed:>7}{nodes:>12,}{elapsed:>10.2f}{base / elapsed:>9.2f}")
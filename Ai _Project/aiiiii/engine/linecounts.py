@@ -0,0 +1,126 @@
+import sys
+import time
+
+from .deepening import depth_limited_search
+from .heuristics import winning_move_or_block_evaluation
+from .mnk import WIN_SCORE, SearchLimit, create_board, get_geometry
+
+class LineCounts:
+    # Board with per-line X and O counts kept up to date by make/unmake, so
+    # wins, one-move-from-complete lines and dead lines (holding both X and
+    # O) are tracked in O(lines through the move) instead of rescanning
+    # every line. Totals over all lines:
+    #   won          lines filled by one player
+    #   threats[p]   lines one move from completion for p, with no opponent stone
+    #   live         lines still winnable by someone
+    def __init__(self, board, geometry):
+        self.geometry = geometry
+        self.board = [" "] * geometry.size
+        self.empty = geometry.size
+        self.k = geometry.k
+        line_ids = {line: index for index, line in enumerate(geometry.lines)}
+        self.cell_lines = [[line_ids[line] for line in lines] for lines in geometry.cell_lines]
+        self.x_counts = [0] * len(geometry.lines)
+        self.o_counts = [0] * len(geometry.lines)
+        self.won = 0
+        self.threats = {"X": 0, "O": 0}
+        self.live = len(geometry.lines)
+        for i, cell in enumerate(board):
+            if cell != " ":
+                self.make(i, cell)
+
+    def add(self, line, sign):
+        # Adds (sign=1) or removes (sign=-1) one line's contribution to the totals
+        x, o = self.x_counts[line], self.o_counts[line]
+        if x == self.k or o == self.k:
+            self.won += sign
+        if o == 0 and x == self.k - 1:
+            self.threats["X"] += sign
+        elif x == 0 and o == self.k - 1:
+            self.threats["O"] += sign
+        if x == 0 or o == 0:
+            self.live += sign
+
+    def make(self, i, player):
+        counts = self.x_counts if player == "X" else self.o_counts
+        for line in self.cell_lines[i]:
+            self.add(line, -1)
+            counts[line] += 1
+            self.add(line, 1)
+        self.board[i] = player
+        self.empty -= 1
+
+    def unmake(self, i):
+        counts = self.x_counts if self.board[i] == "X" else self.o_counts
+        for line in self.cell_lines[i]:
+            self.add(line, -1)
+            counts[line] -= 1
+            self.add(line, 1)
+        self.board[i] = " "
+        self.empty += 1
+
+    def evaluate(self):
+        # Same score as heuristics.winning_move_or_block_evaluation: +10 per own
+        # threat and +5 per opponent threat, for "O" minus for "X"
+        return 5 * (self.threats["O"] - self.threats["X"])
+
+def line_count_search(counts, depth, max_depth, alpha, beta, is_maximizing, limit):
+    # Depth-limited alpha-beta over a LineCounts board, leaves scored by counts.evaluate();
+    # positions with no live line are scored as draws without searching further
+    limit.tick()
+    if counts.won:
+        return -WIN_SCORE if is_maximizing else WIN_SCORE
+    elif counts.empty == 0 or counts.live == 0:
+        return 0
+    elif depth >= max_depth:
+        return counts.evaluate()
+
+    board = counts.board
+    best_eval = float('-inf') if is_maximizing else float('inf')
+    for i in range(counts.geometry.size):
+        if board[i] != " ":
+            continue
+        counts.make(i, "O" if is_maximizing else "X")
+        try:
+            eval_score = line_count_search(counts, depth + 1, max_depth, alpha, beta, not is_maximizing, limit)
+        finally:
+            counts.unmake(i)
+        if is_maximizing:
+            best_eval = max(best_eval, eval_score)
+            alpha = max(alpha, eval_score)
+        else:
+            best_eval = min(best_eval, eval_score)
+            beta = min(beta, eval_score)
+        if beta <= alpha:
+            break
+    return best_eval
+
+def compare(sizes=((3, 3), (4, 4), (5, 4)), max_depth=4):
+    # Empty-board search with the win/block evaluation, list board vs line counts
+    rows = []
+    for n, k in sizes:
+        geometry = get_geometry(n, k)
+        start_time = time.perf_counter()
+        limit = SearchLimit()
+        list_score, _ = depth_limited_search(create_board(n), 0, max_depth, float('-inf'), float('inf'), True,
+                                             geometry, limit, winning_move_or_block_evaluation, [])
+        list_time, list_nodes = time.perf_counter() - start_time, limit.nodes
+        start_time = time.perf_counter()
+        limit = SearchLimit()
+        count_score = line_count_search(LineCounts(create_board(n), geometry), 0, max_depth,
+                                        float('-inf'), float('inf'), True, limit)
+        count_time, count_nodes = time.perf_counter() - start_time, limit.nodes
+        rows.append((n, k, len(geometry.lines), list_score, count_score,
+                     list_nodes, list_time, count_nodes, count_time))
+    return rows
+
+if __name__ == "__main__":
+    max_depth = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    print(f"depth {max_depth}, win/block evaluation")
+    print(f"{'board':<10}{'lines':>6}{'score':>7}{'list nodes':>12}{'seconds':>9}{'count nodes':>13}{'seconds':>9}"
+          f"{'speedup':>9}")
+    for n, k, lines, list_score, count_score, list_nodes, list_time, count_nodes, count_time in \
+            compare(max_depth=max_depth):
+        score = list_score if list_score == count_score else f"{list_score}/{count_score}"
+        print(f"{f'{n}x{n} k={k}':<10}{lines:>6}{score:>7}{list_nodes:>12,}{list_time:>9.3f}{count_nodes:>13,}"
+              f"{count_time:>9.3f}{list_time / count_time:>8.1f}x")
@@ -0,0 +1,12 @@
+def choose_move(board, search, book=None, tablebase=None, limit=None):
+    # Move for "O": the opening book's while the game is still in it, then the
+    # tablebase's, then search(board, limit=limit). book and tablebase are
+    # None when they have not been generated; anything with best_move(board)
+    # can stand in for the tablebase, e.g. a movetable.MoveTable, and a None
+    # move from it (an UNKNOWN entry) falls through to the search.
+    for table in (book, tablebase):
+        if table is not None:
+            move = table.best_move(board)
+            if move is not None:
+                return move
+    return search(board, limit=limit)
@@ -0,0 +1,201 @@
+import math
+import random
+import sys
+import time
+
+from .mnk import SearchAborted, SearchLimit, check_winner, completes_line, create_board, get_geometry, is_board_full
+
+EXPLORATION = 1.4
+
+def other_player(player):
+    return "O" if player == "X" else "X"
+
+def random_rollout(board, player, empty, geometry, rng):
+    # Plays the empty squares in random order; returns the winner or None for a draw
+    rng.shuffle(empty)
+    for i in empty:
+        board[i] = player
+        if completes_line(board, i, geometry):
+            return player
+        player = other_player(player)
+    return None
+
+def winning_square(board, empty, player, geometry):
+    for i in empty:
+        board[i] = player
+        won = completes_line(board, i, geometry)
+        board[i] = " "
+        if won:
+            return i
+    return None
+
+def tactical_rollout(board, player, empty, geometry, rng):
+    # Like blocking.strategic_blocking for both sides: complete a line if
+    # possible, else block the opponent's, else play at random
+    while empty:
+        other = other_player(player)
+        i = winning_square(board, empty, player, geometry)
+        if i is None:
+            i = winning_square(board, empty, other, geometry)
+        if i is None:
+            i = empty[rng.randrange(len(empty))]
+        empty.remove(i)
+        board[i] = player
+        if completes_line(board, i, geometry):
+            return player
+        player = other
+    return None
+
+ROLLOUTS = {
+    "random": random_rollout,
+    "tactical": tactical_rollout,
+}
+
+class Node:
+    def __init__(self, parent, move, player, moves, winner=None):
+        self.parent = parent
+        self.move = move
+        self.player = player  # to move here; other_player(player) made self.move
+        self.untried = moves
+        self.children = []
+        self.visits = 0
+        self.score = 0.0  # for the player who made self.move: 1 per win, 0.5 per draw
+        self.winner = winner
+
+    def select(self, exploration):
+        # UCT: the child with the best average score plus exploration bonus
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda child: child.score / child.visits
+                   + exploration * math.sqrt(log_visits / child.visits))
+
+def mcts(board, geometry, limit=None, is_maximizing=True, rollout=random_rollout, rng=random,
+         exploration=EXPLORATION, metrics=None):
+    # Runs UCT playouts until limit (a SearchLimit, one tick per playout) is
+    # used up and returns (most visited move, root node). Each playout costs
+    # O(board size), so the time taken grows linearly with the budget.
+    if limit is None:
+        limit = SearchLimit(nodes=1000)
+    elif limit.max_nodes is None and limit.deadline is None:
+        raise ValueError("mcts needs a playout or time budget")
+    if metrics is not None:
+        metrics.searches += 1
+    player = "O" if is_maximizing else "X"
+    moves = [i for i in range(geometry.size) if board[i] == " "]
+    root = Node(None, None, player, moves)
+    if not moves or check_winner(board, geometry):
+        return None, root
+    rng.shuffle(root.untried)
+    while True:
+        try:
+            limit.tick()
+        except SearchAborted:
+            break
+        # SearchLimit only reads the clock every 64 ticks, too coarse for whole playouts
+        if limit.deadline is not None and time.perf_counter() > limit.deadline:
+            break
+        node = root
+        scratch = list(board)
+        depth = 0
+        # Selection
+        while not node.untried and node.children:
+            node = node.select(exploration)
+            scratch[node.move] = other_player(node.player)
+            depth += 1
+        # Expansion
+        if node.untried and node.winner is None:
+            i = node.untried.pop()
+            scratch[i] = node.player
+            won = completes_line(scratch, i, geometry)
+            empty = [] if won else [j for j in range(geometry.size) if scratch[j] == " "]
+            rng.shuffle(empty)
+            child = Node(node, i, other_player(node.player), empty, node.player if won else None)
+            node.children.append(child)
+            node = child
+            if metrics is not None:
+                metrics.node(depth + 1)
+        # Simulation
+        if node.winner is not None:
+            winner = node.winner
+            if metrics is not None:
+                metrics.terminal()
+        else:
+            empty = [j for j in range(geometry.size) if scratch[j] == " "]
+            winner = rollout(scratch, node.player, empty, geometry, rng) if empty else None
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            if winner is None:
+                node.score += 0.5
+            elif winner != node.player:
+                node.score += 1
+            node = node.parent
+    if not root.children:
+        return root.untried[-1], root
+    return max(root.children, key=lambda child: child.visits).move, root
+
+def playout_rates(sizes=((3, 3), (5, 4), (7, 5), (10, 5), (15, 5)), seconds=1.0, rollouts=ROLLOUTS, seed=0):
+    # Playouts per second from the empty board for each size and rollout policy
+    rows = []
+    for n, k in sizes:
+        geometry = get_geometry(n, k)
+        for name, rollout in rollouts.items():
+            limit = SearchLimit(seconds=seconds)
+            start_time = time.perf_counter()
+            move, root = mcts(create_board(n), geometry, limit, rollout=rollout, rng=random.Random(seed))
+            elapsed = time.perf_counter() - start_time
+            rows.append((n, k, name, move, root.visits, elapsed, root.visits / elapsed))
+    return rows
+
+def budget_scaling(n=7, k=5, budgets=(250, 500, 1000, 2000, 4000), seed=0):
+    # Seconds for growing playout budgets on one board: the cost should grow linearly
+    geometry = get_geometry(n, k)
+    rows = []
+    for playouts in budgets:
+        start_time = time.perf_counter()
+        move, _ = mcts(create_board(n), geometry, SearchLimit(nodes=playouts), rng=random.Random(seed))
+        rows.append((playouts, move, time.perf_counter() - start_time))
+    return rows
+
+def play_3x3(playouts=2000, rollout=random_rollout, games=20, seed=0):
+    # MCTS as "O" against perfect play as "X" on 3x3, X moving first;
+    # returns (wins, draws, losses) for MCTS
+    from .heuristics import perfect_move
+
+    geometry = get_geometry(3)
+    rng = random.Random(seed)
+    values = {}
+    results = [0, 0, 0]
+    for _ in range(games):
+        board = create_board()
+        is_maximizing = False
+        while not check_winner(board, geometry) and not is_board_full(board):
+            if is_maximizing:
+                move, _ = mcts(board, geometry, SearchLimit(nodes=playouts), rollout=rollout, rng=rng)
+            else:
+                move = perfect_move(board, False, values)
+            board[move] = "O" if is_maximizing else "X"
+            is_maximizing = not is_maximizing
+        if not check_winner(board, geometry):
+            results[1] += 1
+        elif is_maximizing:
+            results[2] += 1  # X made the last move
+        else:
+            results[0] += 1
+    return tuple(results)
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    print(f"{'board':<12}{'rollout':<10}{'move':>6}{'playouts':>10}{'seconds':>9}{'playouts/sec':>14}")
+    for n, k, name, move, playouts, elapsed, rate in playout_rates(seconds=seconds):
+        board = f"{n}x{n} k={k}"
+        print(f"{board:<12}{name:<10}{move:>6}{playouts:>10,}{elapsed:>9.2f}{rate:>14,.0f}")
+    print()
+    print("7x7 k=5, random rollouts")
+    print(f"{'playouts':>10}{'move':>6}{'seconds':>9}{'ms/playout':>12}")
+    for playouts, move, elapsed in budget_scaling():
+        print(f"{playouts:>10,}{move:>6}{elapsed:>9.2f}{elapsed / playouts * 1e3:>12.3f}")
+    print()
+    print("3x3 against perfect play, 2000 playouts per move")
+    for name, rollout in ROLLOUTS.items():
+        wins, draws, losses = play_3x3(rollout=rollout)
+        print(f"{name:<10}W {wins}  D {draws}  L {losses}")
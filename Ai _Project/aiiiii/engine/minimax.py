@@ -0,0 +1,86 @@
+import time
+
+from .board import check_winner, is_board_full
+
+def minimax(board, depth, is_maximizing, metrics=None, limit=None):
+    if limit is not None:
+        limit.tick()
+    if metrics is not None:
+        metrics.node(depth)
+    if check_winner(board):
+        if metrics is not None:
+            metrics.terminal()
+        return -1 if is_maximizing else 1
+    elif is_board_full(board):
+        if metrics is not None:
+            metrics.terminal()
+        return 0
+
+    scores = []
+    for i in range(9):
+        if board[i] == " ":
+            board[i] = "O" if is_maximizing else "X"
+            score = minimax(board, depth + 1, not is_maximizing, metrics, limit)
+            board[i] = " "
+            scores.append(score)
+
+    return max(scores) if is_maximizing else min(scores)
+
+def find_best_move(board, metrics=None, limit=None):
+    # Best square for "O", trying every empty square in index order
+    if metrics is not None:
+        metrics.searches += 1
+    best_score = float('-inf')
+    best_move = None
+    for i in range(9):
+        if board[i] == " ":
+            start_time = time.perf_counter()
+            board[i] = "O"
+            score = minimax(board, 1, False, metrics, limit)
+            board[i] = " "
+            if metrics is not None:
+                metrics.root_move(i, time.perf_counter() - start_time)
+            if score > best_score:
+                best_score = score
+                best_move = i
+    return best_move
+
+def minimax_with_move(board, depth, is_maximizing, metrics=None, limit=None):
+    # Returns (score, best move) in one pass, counting into metrics
+    # (an instrumentation.SearchMetrics)
+    if limit is not None:
+        limit.tick()
+    if metrics is not None:
+        metrics.node(depth)
+    if check_winner(board):
+        if metrics is not None:
+            metrics.terminal()
+        return -1 if is_maximizing else 1, None
+    elif is_board_full(board):
+        if metrics is not None:
+            metrics.terminal()
+        return 0, None
+
+    best_move = None
+    if is_maximizing:
+        max_eval = float('-inf')
+        for i in range(9):
+            if board[i] == " ":
+                board[i] = "O"
+                eval, _ = minimax_with_move(board, depth + 1, False, metrics, limit)
+                board[i] = " "
+                if eval > max_eval:
+                    max_eval = eval
+                    best_move = i
+        return max_eval, best_move
+    else:
+        min_eval = float('inf')
+        for i in range(9):
+            if board[i] == " ":
+                board[i] = "X"
+                eval, _ = minimax_with_move(board, depth + 1, True, metrics, limit)
+                board[i] = " "
+                if eval < min_eval:
+                    min_eval = eval
+                    best_move = i
+        return min_eval, best_move
@@ -0,0 +1,272 @@
+import time
+
+# Terminal score for a win; heuristic evaluations stay well below it
+WIN_SCORE = 1000
+CELLS = {" ": 0, "X": 1, "O": 2}  # base-3 digit of each cell in a position index
+
+class SearchAborted(Exception):
+    pass
+
+class SearchLimit:
+    # stop is a threading.Event another thread sets to abort the search
+    def __init__(self, nodes=None, seconds=None, stop=None):
+        self.max_nodes = nodes
+        self.deadline = None if seconds is None else time.perf_counter() + seconds
+        self.stop = stop
+        self.nodes = 0
+
+    def tick(self):
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise SearchAborted()
+        if self.nodes & 63 == 0:
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                raise SearchAborted()
+            if self.stop is not None and self.stop.is_set():
+                raise SearchAborted()
+
+class Geometry:
+    def __init__(self, n, k):
+        self.n = n
+        self.k = k
+        self.size = n * n
+        self.lines = []
+        for row in range(n):
+            for col in range(n):
+                for dr, dc in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+                    end_row, end_col = row + dr * (k - 1), col + dc * (k - 1)
+                    if 0 <= end_row < n and 0 <= end_col < n:
+                        self.lines.append(tuple((row + dr * j) * n + col + dc * j for j in range(k)))
+        # cell_lines[i] holds every line that passes through square i
+        self.cell_lines = [[line for line in self.lines if i in line] for i in range(self.size)]
+        # The 8 rotations/reflections as permutations: transformed[j] = board[p[j]]
+        self.symmetries = []
+        for reflect in (False, True):
+            for turns in range(4):
+                p = []
+                for row in range(n):
+                    for col in range(n):
+                        r, c = row, col
+                        for _ in range(turns):
+                            r, c = n - 1 - c, r
+                        if reflect:
+                            c = n - 1 - c
+                        p.append(r * n + c)
+                self.symmetries.append(tuple(p))
+
+geometries = {}
+
+def get_geometry(n=3, k=None):
+    if k is None:
+        k = n
+    if (n, k) not in geometries:
+        geometries[(n, k)] = Geometry(n, k)
+    return geometries[(n, k)]
+
+def create_board(n=3):
+    return [" " for _ in range(n * n)]
+
+def check_winner(board, geometry):
+    for line in geometry.lines:
+        # The first two squares and the last rule out most lines, and decide
+        # k=3 lines, without a loop
+        first = board[line[0]]
+        if first == board[line[1]] == board[line[-1]] != " ":
+            for i in line[2:-1]:
+                if board[i] != first:
+                    break
+            else:
+                return True
+    return False
+
+def is_board_full(board):
+    return " " not in board
+
+def completes_line(board, i, geometry):
+    # True when the stone on square i completes a line; only the lines through i are checked
+    player = board[i]
+    for line in geometry.cell_lines[i]:
+        for j in line:
+            if board[j] != player:
+                break
+        else:
+            return True
+    return False
+
+def make_move(board, i, player, geometry):
+    # Plays square i and returns whether that move won
+    board[i] = player
+    return completes_line(board, i, geometry)
+
+def symmetric_moves(board, geometry):
+    # One empty square per class of moves that are equivalent under the
+    # rotations/reflections leaving the board unchanged
+    stabilizer = [p for p in geometry.symmetries if all(board[p[j]] == board[j] for j in range(geometry.size))]
+    return [i for i in range(geometry.size)
+            if board[i] == " " and all(p[i] >= i for p in stabilizer)]
+
+def canonical_index(board, geometry):
+    # Smallest base-3 position index over the 8 rotations/reflections, and
+    # the permutation p giving it: square m of the canonical board is square
+    # p[m] of board. Symmetric positions share the index.
+    best_index, best_p = None, None
+    for p in geometry.symmetries:
+        index = 0
+        for j in reversed(range(geometry.size)):
+            index = index * 3 + CELLS[board[p[j]]]
+        if best_index is None or index < best_index:
+            best_index, best_p = index, p
+    return best_index, best_p
+
+def minimax(board, depth, is_maximizing, geometry, limit=None, metrics=None):
+    if limit is not None:
+        limit.tick()
+    if metrics is not None:
+        metrics.node(depth)
+    if check_winner(board, geometry):
+        if metrics is not None:
+            metrics.terminal()
+        return -WIN_SCORE if is_maximizing else WIN_SCORE
+    elif is_board_full(board):
+        if metrics is not None:
+            metrics.terminal()
+        return 0
+
+    scores = []
+    for i in range(geometry.size):
+        if board[i] == " ":
+            board[i] = "O" if is_maximizing else "X"
+            try:
+                score = minimax(board, depth + 1, not is_maximizing, geometry, limit, metrics)
+            finally:
+                board[i] = " "
+            scores.append(score)
+
+    return max(scores) if is_maximizing else min(scores)
+
+def alpha_beta_pruning(board, depth, alpha, beta, is_maximizing, geometry, limit=None, ordering=None,
+                       metrics=None):
+    if limit is not None:
+        limit.tick()
+    if metrics is not None:
+        metrics.node(depth)
+    if check_winner(board, geometry):
+        if metrics is not None:
+            metrics.terminal()
+        return -WIN_SCORE if is_maximizing else WIN_SCORE
+    elif is_board_full(board):
+        if metrics is not None:
+            metrics.terminal()
+        return 0
+
+    if ordering is not None:
+        moves = ordering.order(board, depth)
+    else:
+        moves = [i for i in range(geometry.size) if board[i] == " "]
+
+    if is_maximizing:
+        max_eval = float('-inf')
+        for move_number, i in enumerate(moves):
+            board[i] = "O"
+            try:
+                eval_score = alpha_beta_pruning(board, depth + 1, alpha, beta, False, geometry, limit, ordering,
+                                                metrics)
+            finally:
+                board[i] = " "
+            max_eval = max(max_eval, eval_score)
+            alpha = max(alpha, eval_score)
+            if beta <= alpha:
+                if ordering is not None:
+                    ordering.record_cutoff(i, depth, board.count(" "), move_number == 0)
+                if metrics is not None:
+                    metrics.cutoff()
+                break
+        return max_eval
+    else:
+        min_eval = float('inf')
+        for move_number, i in enumerate(moves):
+            board[i] = "X"
+            try:
+                eval_score = alpha_beta_pruning(board, depth + 1, alpha, beta, True, geometry, limit, ordering,
+                                                metrics)
+            finally:
+                board[i] = " "
+            min_eval = min(min_eval, eval_score)
+            beta = min(beta, eval_score)
+            if beta <= alpha:
+                if ordering is not None:
+                    ordering.record_cutoff(i, depth, board.count(" "), move_number == 0)
+                if metrics is not None:
+                    metrics.cutoff()
+                break
+        return min_eval
+
+def alpha_beta_last_move(board, depth, alpha, beta, is_maximizing, geometry, limit=None, metrics=None, empty=None):
+    # alpha_beta_pruning for a position nobody has won yet. make_move reports a
+    # win as it is played, so no node rescans every line of the board.
+    if limit is not None:
+        limit.tick()
+    if metrics is not None:
+        metrics.node(depth)
+    if empty is None:
+        empty = board.count(" ")
+    if empty == 0:
+        if metrics is not None:
+            metrics.terminal()
+        return 0
+
+    player = "O" if is_maximizing else "X"
+    best_eval = float('-inf') if is_maximizing else float('inf')
+    for i in range(geometry.size):
+        if board[i] != " ":
+            continue
+        try:
+            if make_move(board, i, player, geometry):
+                # The winning child is still counted as a node, as in alpha_beta_pruning
+                if limit is not None:
+                    limit.tick()
+                if metrics is not None:
+                    metrics.node(depth + 1)
+                    metrics.terminal()
+                eval_score = WIN_SCORE if is_maximizing else -WIN_SCORE
+            else:
+                eval_score = alpha_beta_last_move(board, depth + 1, alpha, beta, not is_maximizing, geometry, limit,
+                                                  metrics, empty - 1)
+        finally:
+            board[i] = " "
+        if is_maximizing:
+            best_eval = max(best_eval, eval_score)
+            alpha = max(alpha, eval_score)
+        else:
+            best_eval = min(best_eval, eval_score)
+            beta = min(beta, eval_score)
+        if beta <= alpha:
+            if metrics is not None:
+                metrics.cutoff()
+            break
+    return best_eval
+
+def best_move(board, geometry, use_alpha_beta=True, limit=None, metrics=None):
+    # Best (square, score) for "O", searched the same way as make_ai_move
+    if metrics is not None:
+        metrics.searches += 1
+    best_score = float('-inf')
+    best_index = None
+    for i in range(geometry.size):
+        if board[i] == " ":
+            start_time = time.perf_counter()
+            board[i] = "O"
+            try:
+                if use_alpha_beta:
+                    score = alpha_beta_pruning(board, 1, float('-inf'), float('inf'), False, geometry, limit,
+                                               metrics=metrics)
+                else:
+                    score = minimax(board, 1, False, geometry, limit, metrics)
+            finally:
+                board[i] = " "
+            if metrics is not None:
+                metrics.root_move(i, time.perf_counter() - start_time)
+            if score > best_score:
+                best_score = score
+                best_index = i
+    return best_index, best_score
@@ -0,0 +1,91 @@
+import mmap
+import os
+import struct
+import sys
+
+from .bitboard import WIN_TABLE, FULL, EMPTY_SQUARES, from_list
+
+# One little-endian uint16 per (position, side to move):
+#   bits 0-8  mask of every optimal square
+#   bits 9-10 value for "O" plus one (0 = X wins, 1 = draw, 2 = O wins)
+# Positions that cannot occur in a game are stored as UNKNOWN.
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "movetable.bin")
+POWERS = [3 ** i for i in range(9)]
+ENTRIES = 2 * 3 ** 9
+UNKNOWN = 0xFFFF
+
+def position_index(board, player):
+    # board is a (x, o) bitboard, player the side to move
+    index = 0
+    for i in range(9):
+        if board[0] >> i & 1:
+            index += POWERS[i]
+        elif board[1] >> i & 1:
+            index += 2 * POWERS[i]
+    return 2 * index + (player == "O")
+
+def solve(x, o, o_to_move, table):
+    index = position_index((x, o), "O" if o_to_move else "X")
+    if table[index] != UNKNOWN:
+        return (table[index] >> 9) - 1
+
+    if WIN_TABLE[x]:
+        value, moves = -1, 0
+    elif WIN_TABLE[o]:
+        value, moves = 1, 0
+    elif x | o == FULL:
+        value, moves = 0, 0
+    else:
+        scores = []
+        for i, bit in EMPTY_SQUARES[x | o]:
+            if o_to_move:
+                scores.append((solve(x, o | bit, False, table), i))
+            else:
+                scores.append((solve(x | bit, o, True, table), i))
+        value = max(scores)[0] if o_to_move else min(scores)[0]
+        moves = sum(1 << i for score, i in scores if score == value)
+
+    table[index] = (value + 1) << 9 | moves
+    return value
+
+def generate(path=DEFAULT_PATH):
+    table = [UNKNOWN] * ENTRIES
+    solve(0, 0, True, table)
+    solve(0, 0, False, table)
+    with open(path, "wb") as f:
+        f.write(struct.pack(f"<{ENTRIES}H", *table))
+    return sum(entry != UNKNOWN for entry in table)
+
+class MoveTable:
+    def __init__(self, path=DEFAULT_PATH):
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def lookup(self, board, player="O"):
+        # Returns (value for "O", list of optimal squares) or None
+        if isinstance(board, list):
+            board = from_list(board)
+        entry = struct.unpack_from("<H", self.data, 2 * position_index(board, player))[0]
+        if entry == UNKNOWN:
+            return None
+        return (entry >> 9) - 1, [i for i in range(9) if entry >> i & 1]
+
+    def best_move(self, board, player="O"):
+        result = self.lookup(board, player)
+        if result is None or not result[1]:
+            return None
+        return result[1][0]
+
+    def close(self):
+        self.data.close()
+
+def load_table(path=DEFAULT_PATH):
+    # None when the table has not been generated yet
+    if not os.path.exists(path):
+        return None
+    return MoveTable(path)
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    count = generate(path)
+    print(f"Wrote {count} positions to {path} ({os.path.getsize(path)} bytes)")
@@ -0,0 +1,103 @@
+import time
+
+from . import mnk
+from .alphabeta import alpha_beta_pruning
+from .ordering import MoveOrdering
+from .positions import standard_positions
+from .pvs import principal_variation_search
+from .transposition import TranspositionTable
+from .zobrist import ZobristHash
+
+def root_search(board, alpha, beta, is_maximizing, geometry, table, limit=None, ordering=None, metrics=None,
+                zobrist=None):
+    # alphabeta.alpha_beta_pruning, with its table, over the root moves inside the
+    # window (alpha, beta), also returning the move that decided the score
+    if zobrist is None:
+        zobrist = ZobristHash(board, geometry)
+    if limit is not None:
+        limit.tick()
+    if metrics is not None:
+        metrics.node(0)
+    if ordering is not None:
+        moves = ordering.order(board, 0)
+    else:
+        moves = [i for i in range(geometry.size) if board[i] == " "]
+
+    best_eval = float('-inf') if is_maximizing else float('inf')
+    best_move = None
+    player = "O" if is_maximizing else "X"
+    for i in moves:
+        start_time = time.perf_counter()
+        board[i] = player
+        zobrist.make(i, player)
+        try:
+            eval_score = alpha_beta_pruning(board, 1, alpha, beta, not is_maximizing, table, zobrist, metrics,
+                                            ordering, limit, geometry)
+        finally:
+            board[i] = " "
+            zobrist.unmake(i, player)
+        if metrics is not None:
+            metrics.root_move(i, time.perf_counter() - start_time)
+        if is_maximizing and eval_score > best_eval:
+            best_eval, best_move = eval_score, i
+            alpha = max(alpha, eval_score)
+        elif not is_maximizing and eval_score < best_eval:
+            best_eval, best_move = eval_score, i
+            beta = min(beta, eval_score)
+        if beta <= alpha:
+            break
+    return best_eval, best_move
+
+def mtdf(board, geometry, first_guess=0, table=None, is_maximizing=True, limit=None, ordering=None,
+         metrics=None):
+    # Converges on the minimax value with zero-window searches;
+    # returns (value, best move, number of passes)
+    if table is None:
+        table = TranspositionTable(size=1 << 16)
+    if metrics is not None:
+        metrics.searches += 1
+    zobrist = ZobristHash(board, geometry)
+    g = first_guess
+    lower, upper = float('-inf'), float('inf')
+    best_move = None
+    passes = 0
+    while lower < upper:
+        beta = max(g, lower + 1)
+        g, move = root_search(board, beta - 1, beta, is_maximizing, geometry, table, limit, ordering, metrics,
+                              zobrist)
+        passes += 1
+        if g < beta:
+            upper = g
+            if not is_maximizing:
+                best_move = move
+        else:
+            lower = g
+            if is_maximizing:
+                best_move = move
+    return g, best_move, passes
+
+def compare(n=3, k=None):
+    # Total nodes over the standard position set for alpha-beta, PVS and MTD(f)
+    geometry = mnk.get_geometry(n, k)
+    totals = {}
+    for use_ordering in (False, True):
+        suffix = " +ordering" if use_ordering else ""
+        for name in ("alpha-beta", "pvs", "mtdf"):
+            totals[name + suffix] = 0
+        totals["mtdf passes" + suffix] = 0
+        for _, board, is_maximizing in standard_positions(n, k):
+            for name, search in [("alpha-beta", mnk.alpha_beta_pruning), ("pvs", principal_variation_search)]:
+                limit = mnk.SearchLimit()
+                ordering = MoveOrdering(geometry) if use_ordering else None
+                search(board, 0, float('-inf'), float('inf'), is_maximizing, geometry, limit, ordering)
+                totals[name + suffix] += limit.nodes
+            limit = mnk.SearchLimit()
+            ordering = MoveOrdering(geometry) if use_ordering else None
+            _, _, passes = mtdf(board, geometry, is_maximizing=is_maximizing, limit=limit, ordering=ordering)
+            totals["mtdf" + suffix] += limit.nodes
+            totals["mtdf passes" + suffix] += passes
+    return totals
+
+if __name__ == "__main__":
+    for name, total in compare().items():
+        print(f"{name:<24}{total:>10,}")
@@ -0,0 +1,158 @@
+import os
+import struct
+import sys
+import time
+
+from .deepening import depth_limited_move
+from .heuristics import EVALUATIONS
+from .mnk import canonical_index, check_winner, create_board, get_geometry, is_board_full
+from .mtdf import mtdf
+from .transposition import TranspositionTable
+
+# Book file: HEADER, then one entry per position sorted by key:
+#   key    little-endian, key_bytes(geometry) wide; canonical position index
+#          times two plus one when "O" is to move
+#   move   uint8, best square on the canonical board
+#   depth  uint8, plies searched, EXACT when the move was solved to the end
+HEADER = struct.Struct("<4sBBI")
+MAGIC = b"OBK2"
+EXACT = 255
+BOOK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def book_path(n=3, k=None):
+    return os.path.join(BOOK_DIR, f"openingbook_{n}x{n}_k{k or n}.bin")
+
+def key_bytes(geometry):
+    # Whole bytes for the largest key, 2 * 3**size - 1
+    return ((2 * 3 ** geometry.size - 1).bit_length() + 7) // 8
+
+def canonical_key(board, player, geometry):
+    # Book key of the canonical position and the permutation p giving it,
+    # see mnk.canonical_index
+    index, p = canonical_index(board, geometry)
+    return 2 * index + (player == "O"), p
+
+def book_positions(geometry, plies):
+    # (board, player to move) after fewer than plies moves, with either side
+    # moving first, one per symmetry class; finished games are left out
+    positions = {}
+    frontier = [(create_board(geometry.n), first) for first in ("X", "O")]
+    for _ in range(plies):
+        next_frontier = []
+        for board, player in frontier:
+            key, _ = canonical_key(board, player, geometry)
+            if key in positions or check_winner(board, geometry) or is_board_full(board):
+                continue
+            positions[key] = (board, player)
+            other = "O" if player == "X" else "X"
+            for i in range(geometry.size):
+                if board[i] == " ":
+                    child = list(board)
+                    child[i] = player
+                    next_frontier.append((child, other))
+        frontier = next_frontier
+    return positions
+
+class OpeningBook:
+    def __init__(self, geometry, entries=None):
+        self.geometry = geometry
+        self.entries = {} if entries is None else entries  # key -> (canonical move, depth)
+
+    def lookup(self, board, player="O"):
+        # Returns (square, depth searched) or None
+        key, p = canonical_key(board, player, self.geometry)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        move, depth = entry
+        return p[move], depth
+
+    def best_move(self, board, player="O"):
+        result = self.lookup(board, player)
+        if result is None:
+            return None
+        return result[0]
+
+    def extend(self, plies, depth=None, evaluate=EVALUATIONS["weighted"]):
+        # Searches every position of the first plies moves, and every position
+        # already in the book, that was not yet searched to depth (None solves
+        # to the end); returns the number of positions searched
+        positions = book_positions(self.geometry, plies)
+        for key in self.entries:
+            if key not in positions:
+                positions[key] = position_from_key(key, self.geometry)
+        target = EXACT if depth is None else depth
+        table = TranspositionTable(size=1 << 18)
+        searched = 0
+        for key, (board, player) in sorted(positions.items()):
+            if key in self.entries and self.entries[key][1] >= target:
+                continue
+            is_maximizing = player == "O"
+            empty = board.count(" ")
+            if depth is None:
+                _, move, _ = mtdf(board, self.geometry, table=table, is_maximizing=is_maximizing)
+            else:
+                move, _ = depth_limited_move(board, depth, evaluate, self.geometry, is_maximizing)
+            _, p = canonical_key(board, player, self.geometry)
+            self.entries[key] = (p.index(move), EXACT if depth is None or depth >= empty else depth)
+            searched += 1
+        return searched
+
+    def save(self, path=None):
+        if path is None:
+            path = book_path(self.geometry.n, self.geometry.k)
+        width = key_bytes(self.geometry)
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, self.geometry.n, self.geometry.k, len(self.entries)))
+            for key, (move, depth) in sorted(self.entries.items()):
+                f.write(key.to_bytes(width, "little") + bytes((move, depth)))
+        return os.path.getsize(path)
+
+def position_from_key(key, geometry):
+    # Canonical (board, player to move) stored under key
+    player = "O" if key & 1 else "X"
+    index = key >> 1
+    board = []
+    for _ in range(geometry.size):
+        index, cell = divmod(index, 3)
+        board.append(" XO"[cell])
+    return board, player
+
+def load_book(n=3, k=None, path=None):
+    # None when no book has been generated for this board yet
+    if path is None:
+        path = book_path(n, k)
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, n, k, count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not an opening book")
+    geometry = get_geometry(n, k)
+    width = key_bytes(geometry)
+    entries = {}
+    offset = HEADER.size
+    for _ in range(count):
+        key = int.from_bytes(data[offset:offset + width], "little")
+        entries[key] = (data[offset + width], data[offset + width + 1])
+        offset += width + 2
+    return OpeningBook(geometry, entries)
+
+if __name__ == "__main__":
+    # python -m engine.openingbook [n] [k] [plies] [depth]
+    # Creates or extends the book for n x n, k in a row. Positions already in
+    # the book are searched again only if they were searched shallower than
+    # depth, so running again with a larger depth deepens the whole book.
+    # Without depth every position is solved to the end.
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else n
+    plies = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    depth = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    book = load_book(n, k) or OpeningBook(get_geometry(n, k))
+    start_time = time.perf_counter()
+    searched = book.extend(plies, depth)
+    elapsed = time.perf_counter() - start_time
+    size = book.save()
+    print(f"{n}x{n} k={k}: searched {searched} positions in {elapsed:.2f}s, "
+          f"{len(book.entries)} in {book_path(n, k)} ({size} bytes)")
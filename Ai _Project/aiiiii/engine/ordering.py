@@ -0,0 +1,73 @@
+import sys
+
+from . import mnk
+
+class MoveOrdering:
+    def __init__(self, geometry, static=True, killers=True, history=True):
+        self.use_killers = killers
+        self.use_history = history
+        if static:
+            # Squares on more lines first: center > corner > edge on 3x3
+            self.static_order = sorted(range(geometry.size), key=lambda i: -len(geometry.cell_lines[i]))
+        else:
+            self.static_order = list(range(geometry.size))
+        self.killers = {}  # ply -> up to two moves that caused a cutoff
+        self.history = [0] * geometry.size
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def order(self, board, ply, first=None):
+        moves = [i for i in self.static_order if board[i] == " "]
+        if self.use_history:
+            moves.sort(key=lambda i: -self.history[i])
+        if self.use_killers:
+            for killer in reversed(self.killers.get(ply, [])):
+                if board[killer] == " ":
+                    moves.remove(killer)
+                    moves.insert(0, killer)
+        if first is not None and first in moves:
+            moves.remove(first)
+            moves.insert(0, first)
+        return moves
+
+    def record_cutoff(self, move, ply, remaining, first):
+        self.cutoffs += 1
+        if first:
+            self.first_move_cutoffs += 1
+        if self.use_killers:
+            killers = self.killers.setdefault(ply, [])
+            if move not in killers:
+                killers.insert(0, move)
+                del killers[2:]
+        if self.use_history:
+            self.history[move] += remaining * remaining
+
+    def first_move_cutoff_rate(self):
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    def report(self):
+        return {"cutoffs": self.cutoffs, "first_move_cutoffs": self.first_move_cutoffs,
+                "first_move_cutoff_rate": self.first_move_cutoff_rate()}
+
+CONFIGURATIONS = [
+    ("index order", dict(static=False, killers=False, history=False)),
+    ("static", dict(static=True, killers=False, history=False)),
+    ("static+killers", dict(static=True, killers=True, history=False)),
+    ("static+killers+history", dict(static=True, killers=True, history=True)),
+]
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    for n, k in [(3, 3), (4, 4)]:
+        geometry = mnk.get_geometry(n, k)
+        for name, options in CONFIGURATIONS:
+            ordering = MoveOrdering(geometry, **options)
+            limit = mnk.SearchLimit(seconds=seconds)
+            try:
+                mnk.alpha_beta_pruning(mnk.create_board(n), 0, float('-inf'), float('inf'), True,
+                                       geometry, limit, ordering)
+                status = "solved"
+            except mnk.SearchAborted:
+                status = "timeout"
+            print(f"{n}x{n} k={k} {name:<24}{status:<9}{limit.nodes:>10,} nodes  "
+                  f"first-move cutoffs {ordering.first_move_cutoff_rate():.1%} of {ordering.cutoffs:,}")
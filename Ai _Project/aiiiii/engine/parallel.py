@@ -0,0 +1,117 @@
+import os
+import sys
+import time
+
+from . import mnk
+from .deepening import depth_limited_search, no_evaluation
+from .instrumentation import SearchMetrics
+from .ordering import MoveOrdering
+
+shared_alpha = None  # best root score found so far, shared by every worker
+
+def init_worker(alpha):
+    global shared_alpha
+    shared_alpha = alpha
+
+def search_root_move(board, move, n, k, max_depth, seconds, evaluate, metrics=None):
+    # Returns (move, score, exact, metrics); exact is False when the score is
+    # only an upper bound because the move could not beat the shared alpha.
+    # metrics is this search's own SearchMetrics, sent back to the parent
+    geometry = mnk.get_geometry(n, k)
+    alpha = shared_alpha.value
+    board = list(board)
+    board[move] = "O"
+    start_time = time.perf_counter()
+    try:
+        score, _ = depth_limited_search(board, 1, max_depth, alpha, float('inf'), False, geometry,
+                                        mnk.SearchLimit(seconds=seconds), evaluate, [],
+                                        MoveOrdering(geometry), metrics)
+    except mnk.SearchAborted:
+        return move, None, False, metrics
+    finally:
+        if metrics is not None:
+            metrics.root_move(move, time.perf_counter() - start_time)
+    with shared_alpha.get_lock():
+        if score > shared_alpha.value:
+            shared_alpha.value = score
+    return move, score, score > alpha, metrics
+
+def new_metrics(metrics):
+    return None if metrics is None else SearchMetrics(metrics.engine)
+
+class RootParallelSearch:
+    # Searches each root move (after symmetry reduction) in its own worker
+    # process; positions with fewer than serial_below empty squares are
+    # searched serially because process overhead would dominate
+    def __init__(self, workers=None, serial_below=10):
+        # multiprocessing is only imported by the parent; workers just need search_root_move
+        import multiprocessing
+        self.workers = workers
+        self.serial_below = serial_below
+        self.alpha = multiprocessing.Value("d", float('-inf'))
+        self.executor = None
+
+    def best_move(self, board, geometry, max_depth=None, seconds=None, evaluate=no_evaluation, metrics=None):
+        # Best (square, score) for "O"; seconds bounds each root move search.
+        # metrics gets the counts of every root move search added together
+        moves = mnk.symmetric_moves(board, geometry)
+        if not moves:
+            return None, None
+        if max_depth is None:
+            max_depth = geometry.size
+        self.alpha.value = float('-inf')
+        args = (geometry.n, geometry.k, max_depth, seconds, evaluate)
+
+        if board.count(" ") < self.serial_below or len(moves) == 1:
+            init_worker(self.alpha)
+            results = [search_root_move(board, move, *args, new_metrics(metrics)) for move in moves]
+        else:
+            if self.executor is None:
+                from concurrent.futures import ProcessPoolExecutor
+                self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                                    initargs=(self.alpha,))
+            futures = [self.executor.submit(search_root_move, board, move, *args, new_metrics(metrics))
+                       for move in moves]
+            results = [future.result() for future in futures]
+        if metrics is not None:
+            metrics.searches += 1
+            for result in results:
+                metrics.merge(result[3])
+
+        # Prefer exact scores, then the earliest move among equals
+        finished = [(score, exact, -moves.index(move), move) for move, score, exact, _ in results if score is not None]
+        if not finished:
+            return moves[0], None
+        score, _, _, move = max(finished)
+        return move, score
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+if __name__ == "__main__":
+    # With no_evaluation almost every leaf scores 0 and alpha-beta prunes
+    # nearly everything, leaving too little work to spread over processes;
+    # the weighted heuristic at this depth takes seconds serially
+    from .heuristics import EVALUATIONS
+
+    n, k, depth = (int(arg) for arg in sys.argv[1:4]) if len(sys.argv) > 3 else (5, 4, 6)
+    geometry = mnk.get_geometry(n, k)
+    evaluate = EVALUATIONS["weighted"]
+    print(f"{n}x{n} k={k}, depth {depth}, weighted evaluation, {os.cpu_count()} cpus")
+    serial_seconds = None
+    for label, serial_below in [("serial", geometry.size + 1), ("parallel", 0)]:
+        with RootParallelSearch(serial_below=serial_below) as search:
+            start_time = time.perf_counter()
+            move, score = search.best_move(mnk.create_board(n), geometry, max_depth=depth, evaluate=evaluate)
+            elapsed = time.perf_counter() - start_time
+        if serial_seconds is None:
+            serial_seconds = elapsed
+        print(f"{label:<9}move {move}, score {score}, {elapsed:.2f}s, speedup {serial_seconds / elapsed:.2f}")
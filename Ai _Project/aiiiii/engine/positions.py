@@ -0,0 +1,38 @@
+import itertools
+
+from . import mnk
+
+def standard_positions(n=3, k=None):
+    # (name, board, is_maximizing) for the empty board and every first move,
+    # always with "O" (the AI) to move
+    geometry = mnk.get_geometry(n, k)
+    positions = [("empty", mnk.create_board(n), True)]
+    for i in range(geometry.size):
+        board = mnk.create_board(n)
+        board[i] = "X"
+        positions.append((f"X{i}", board, True))
+    return positions
+
+# Known 3x3 tactical positions, "O" to move
+TACTICAL_POSITIONS = [
+    ("win or block", "OO XX    "),
+    ("must block", "XX  O    "),
+    ("opposite corners", "X   O   X"),
+    ("corner and edge", "X   O  X "),
+    ("late middlegame", "XOX O  X "),
+]
+
+def corpus(n=3, k=None):
+    # Fixed benchmark corpus: the standard positions, every 2-ply position
+    # (X then O, X to move) and on 3x3 the tactical positions
+    geometry = mnk.get_geometry(n, k)
+    positions = standard_positions(n, k)
+    for x, o in itertools.permutations(range(geometry.size), 2):
+        board = mnk.create_board(n)
+        board[x] = "X"
+        board[o] = "O"
+        positions.append((f"X{x}O{o}", board, False))
+    if n == 3:
+        for name, cells in TACTICAL_POSITIONS:
+            positions.append((name, list(cells), True))
+    return positions
@@ -0,0 +1,80 @@
+from . import mnk
+from .mnk import WIN_SCORE, check_winner, is_board_full
+from .ordering import MoveOrdering
+from .positions import standard_positions
+
+def negamax_pvs(board, depth, alpha, beta, player, geometry, limit=None, ordering=None, metrics=None):
+    # Score from the point of view of player, the side to move
+    if limit is not None:
+        limit.tick()
+    if metrics is not None:
+        metrics.node(depth)
+    if check_winner(board, geometry):
+        if metrics is not None:
+            metrics.terminal()
+        return -WIN_SCORE
+    elif is_board_full(board):
+        if metrics is not None:
+            metrics.terminal()
+        return 0
+
+    if ordering is not None:
+        moves = ordering.order(board, depth)
+    else:
+        moves = [i for i in range(geometry.size) if board[i] == " "]
+
+    opponent = "X" if player == "O" else "O"
+    best_eval = float('-inf')
+    for move_number, i in enumerate(moves):
+        board[i] = player
+        try:
+            if move_number == 0:
+                eval_score = -negamax_pvs(board, depth + 1, -beta, -alpha, opponent, geometry, limit, ordering,
+                                          metrics)
+            else:
+                # Zero-window test, re-searched only when the move might improve alpha
+                eval_score = -negamax_pvs(board, depth + 1, -alpha - 1, -alpha, opponent, geometry, limit, ordering,
+                                          metrics)
+                if alpha < eval_score < beta:
+                    eval_score = -negamax_pvs(board, depth + 1, -beta, -eval_score, opponent, geometry, limit,
+                                              ordering, metrics)
+        finally:
+            board[i] = " "
+        best_eval = max(best_eval, eval_score)
+        alpha = max(alpha, eval_score)
+        if beta <= alpha:
+            if ordering is not None:
+                ordering.record_cutoff(i, depth, board.count(" "), move_number == 0)
+            if metrics is not None:
+                metrics.cutoff()
+            break
+    return best_eval
+
+def principal_variation_search(board, depth, alpha, beta, is_maximizing, geometry, limit=None, ordering=None,
+                               metrics=None):
+    # Same arguments and score convention ("O" maximizes) as mnk.alpha_beta_pruning
+    if is_maximizing:
+        return negamax_pvs(board, depth, alpha, beta, "O", geometry, limit, ordering, metrics)
+    return -negamax_pvs(board, depth, -beta, -alpha, "X", geometry, limit, ordering, metrics)
+
+def compare(n=3, k=None):
+    # Node counts of plain alpha-beta and PVS over the standard position set
+    geometry = mnk.get_geometry(n, k)
+    totals = {}
+    for use_ordering in (False, True):
+        for name, search in [("alpha-beta", mnk.alpha_beta_pruning), ("pvs", principal_variation_search)]:
+            label = f"{name}{' +ordering' if use_ordering else ''}"
+            totals[label] = 0
+            for _, board, is_maximizing in standard_positions(n, k):
+                ordering = MoveOrdering(geometry) if use_ordering else None
+                limit = mnk.SearchLimit()
+                search(board, 0, float('-inf'), float('inf'), is_maximizing, geometry, limit, ordering)
+                totals[label] += limit.nodes
+    return totals
+
+if __name__ == "__main__":
+    totals = compare()
+    for use_ordering in ("", " +ordering"):
+        plain, pvs = totals["alpha-beta" + use_ordering], totals["pvs" + use_ordering]
+        print(f"alpha-beta{use_ordering}: {plain:,} nodes, pvs{use_ordering}: {pvs:,} nodes "
+              f"({1 - pvs / plain:.1%} fewer)")
@@ -0,0 +1,87 @@
+import time
+
+from .board import GEOMETRY, check_winner
+from .mnk import canonical_index, symmetric_moves
+
+def minimax(board, depth, is_maximizing, cache=None, zobrist=None, metrics=None, limit=None):
+    # cache maps (canonical position index, is_maximizing) to a value; None searches without symmetry.
+    # With zobrist (a zobrist.SymmetricZobristHash of board) the cache is keyed on
+    # its incrementally updated canonical key instead
+    if limit is not None:
+        limit.tick()
+    if metrics is not None:
+        metrics.node(depth)
+    if check_winner(board):
+        if metrics is not None:
+            metrics.terminal()
+        return -1 if is_maximizing else 1
+    elif " " not in board:
+        if metrics is not None:
+            metrics.terminal()
+        return 0
+
+    if cache is not None:
+        if zobrist is not None:
+            key = zobrist.node_key(is_maximizing)
+        else:
+            key = (canonical_index(board, GEOMETRY)[0], is_maximizing)
+        if metrics is not None:
+            metrics.cache(key in cache)
+        if key in cache:
+            return cache[key]
+        value = search(board, depth, is_maximizing, cache, zobrist, metrics, limit)
+        cache[key] = value
+        return value
+    return search(board, depth, is_maximizing, cache, zobrist, metrics, limit)
+
+def search(board, depth, is_maximizing, cache=None, zobrist=None, metrics=None, limit=None):
+    if is_maximizing:
+        max_eval = float('-inf')
+        for i in range(9):
+            if board[i] == " ":
+                board[i] = "O"
+                if zobrist is not None:
+                    zobrist.make(i, "O")
+                eval = minimax(board, depth + 1, False, cache, zobrist, metrics, limit)
+                board[i] = " "
+                if zobrist is not None:
+                    zobrist.unmake(i, "O")
+                max_eval = max(max_eval, eval)
+        return max_eval
+    else:
+        min_eval = float('inf')
+        for i in range(9):
+            if board[i] == " ":
+                board[i] = "X"
+                if zobrist is not None:
+                    zobrist.make(i, "X")
+                eval = minimax(board, depth + 1, True, cache, zobrist, metrics, limit)
+                board[i] = " "
+                if zobrist is not None:
+                    zobrist.unmake(i, "X")
+                min_eval = min(min_eval, eval)
+        return min_eval
+
+def find_best_move(board, cache=None, zobrist=None, metrics=None, limit=None):
+    # Best square for "O"; with a cache only one move per symmetry class is tried
+    if metrics is not None:
+        metrics.searches += 1
+    best_score = float('-inf')
+    best_move = None
+    moves = symmetric_moves(board, GEOMETRY) if cache is not None else range(9)
+    for i in moves:
+        if board[i] == " ":
+            start_time = time.perf_counter()
+            board[i] = "O"
+            if zobrist is not None:
+                zobrist.make(i, "O")
+            score = minimax(board, 1, False, cache, zobrist, metrics, limit)
+            board[i] = " "
+            if zobrist is not None:
+                zobrist.unmake(i, "O")
+            if metrics is not None:
+                metrics.root_move(i, time.perf_counter() - start_time)
+            if score > best_score:
+                best_score = score
+                best_move = i
+    return best_move
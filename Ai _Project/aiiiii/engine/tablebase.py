@@ -0,0 +1,151 @@
+import mmap
+import os
+import struct
+import sys
+import time
+
+from .mnk import CELLS, check_winner, get_geometry, is_board_full
+
+# Tablebase file: HEADER, then one uint8 per board encoding
+# index = sum(cell * 3**square) with cell 0 empty, 1 "X", 2 "O":
+#   bits 0-1  value with "O" to move, bits 2-3 value with "X" to move,
+#   each stored as value for "O" plus two (1 = X wins, 2 = draw, 3 = O wins)
+#   and 0 for positions that cannot occur with that side to move
+# 3x3 takes 19,683 bytes, 4x4 43,046,721 bytes.
+HEADER = struct.Struct("<4sBB")
+MAGIC = b"TBS1"
+SHIFT = {"O": 0, "X": 2}
+TABLEBASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def tablebase_path(n=3, k=None):
+    return os.path.join(TABLEBASE_DIR, f"tablebase_{n}x{n}_k{k or n}.bin")
+
+def occupancy(np, positions, geometry):
+    # Bitmasks of the "X" and "O" squares of every encoded position
+    x_bits = np.zeros(len(positions), dtype=np.int64)
+    o_bits = np.zeros(len(positions), dtype=np.int64)
+    rest = positions.copy()
+    for i in range(geometry.size):
+        rest, cell = np.divmod(rest, 3)
+        x_bits |= (cell == 1).astype(np.int64) << i
+        o_bits |= (cell == 2).astype(np.int64) << i
+    return x_bits, o_bits
+
+def has_line(np, bits, masks):
+    won = np.zeros(len(bits), dtype=bool)
+    for mask in masks:
+        won |= bits & mask == mask
+    return won
+
+def solve(geometry, path=None):
+    # Retrograde analysis over whole layers of positions at once: a forward
+    # pass collects every position reachable from the empty board (with
+    # either side moving first) by stone count, then a backward pass scores
+    # each layer from the already scored layer below it. Only the layers
+    # are Python loops; every position in a layer is handled by NumPy.
+    import numpy as np
+
+    if path is None:
+        path = tablebase_path(geometry.n, geometry.k)
+    powers = [3 ** i for i in range(geometry.size)]
+    masks = [sum(1 << i for i in line) for line in geometry.lines]
+
+    # layers[t][player]: sorted encodings with t stones and player to move
+    layers = [{"O": np.zeros(1, dtype=np.int64), "X": np.zeros(1, dtype=np.int64)}]
+    for stones in range(geometry.size):
+        children = {"O": [], "X": []}
+        for player, other in (("O", "X"), ("X", "O")):
+            positions = layers[stones][player]
+            x_bits, o_bits = occupancy(np, positions, geometry)
+            live = ~(has_line(np, x_bits, masks) | has_line(np, o_bits, masks))
+            positions, occupied = positions[live], (x_bits | o_bits)[live]
+            for i in range(geometry.size):
+                empty = (occupied >> i & 1) == 0
+                children[other].append(positions[empty] + CELLS[player] * powers[i])
+        layers.append({player: np.unique(np.concatenate(found)) for player, found in children.items()})
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, geometry.n, geometry.k))
+        f.truncate(HEADER.size + 3 ** geometry.size)
+    table = np.memmap(path, dtype=np.uint8, mode="r+", offset=HEADER.size)
+    for stones in range(geometry.size, -1, -1):
+        for player, other in (("O", "X"), ("X", "O")):
+            positions = layers[stones][player]
+            x_bits, o_bits = occupancy(np, positions, geometry)
+            x_won, o_won = has_line(np, x_bits, masks), has_line(np, o_bits, masks)
+            values = np.where(o_won, 1, np.where(x_won, -1, 0)).astype(np.int8)
+            live = ~(x_won | o_won)
+            if stones < geometry.size and live.any():
+                live_positions, occupied = positions[live], (x_bits | o_bits)[live]
+                # O keeps the largest child value, X the smallest; 2 and -2 lose to any real value
+                best = np.full(len(live_positions), -2 if player == "O" else 2, dtype=np.int8)
+                choose = np.maximum if player == "O" else np.minimum
+                for i in range(geometry.size):
+                    empty = (occupied >> i & 1) == 0
+                    child = live_positions[empty] + CELLS[player] * powers[i]
+                    child_values = (table[child] >> SHIFT[other] & 3).astype(np.int8) - 2
+                    best[empty] = choose(best[empty], child_values)
+                values[live] = best
+            table[positions] |= ((values + 2).astype(np.uint8) << SHIFT[player])
+    table.flush()
+    reachable = sum(len(layer[player]) for layer in layers for player in ("O", "X"))
+    del table
+    return reachable
+
+class Tablebase:
+    # Reads a solved tablebase through mmap; a lookup is one byte read
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n, k = HEADER.unpack_from(self.data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a tablebase")
+        self.geometry = get_geometry(n, k)
+        self.powers = [3 ** i for i in range(self.geometry.size)]
+
+    def index(self, board):
+        index = HEADER.size
+        for i, cell in enumerate(board):
+            index += CELLS[cell] * self.powers[i]
+        return index
+
+    def value(self, board, is_maximizing=True):
+        # Value for "O" (1, 0 or -1), None for positions that cannot occur
+        code = self.data[self.index(board)] >> SHIFT["O" if is_maximizing else "X"] & 3
+        return None if code == 0 else code - 2
+
+    def best_move(self, board, is_maximizing=True):
+        # First square in index order with the best value, like minimax.find_best_move
+        player, other = ("O", "X") if is_maximizing else ("X", "O")
+        index = self.index(board)
+        if check_winner(board, self.geometry) or is_board_full(board):
+            return None
+        best_value, best_move = None, None
+        for i in range(self.geometry.size):
+            if board[i] == " ":
+                value = (self.data[index + CELLS[player] * self.powers[i]] >> SHIFT[other] & 3) - 2
+                if best_value is None or (value > best_value if is_maximizing else value < best_value):
+                    best_value, best_move = value, i
+        return best_move
+
+    def close(self):
+        self.data.close()
+
+def load_tablebase(n=3, k=None, path=None):
+    # None when the tablebase has not been generated yet
+    if path is None:
+        path = tablebase_path(n, k)
+    if not os.path.exists(path):
+        return None
+    return Tablebase(path)
+
+if __name__ == "__main__":
+    # python -m engine.tablebase [n] [k]; needs NumPy
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else n
+    start_time = time.perf_counter()
+    reachable = solve(get_geometry(n, k))
+    elapsed = time.perf_counter() - start_time
+    path = tablebase_path(n, k)
+    print(f"{n}x{n} k={k}: solved {reachable:,} reachable positions in {elapsed:.3f}s, "
+          f"wrote {path} ({os.path.getsize(path):,} bytes)")
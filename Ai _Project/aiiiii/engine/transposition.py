@@ -0,0 +1,32 @@
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+class TranspositionTable:
+    def __init__(self, size=4096, replacement="depth"):
+        # replacement is "depth" (keep the deeper search) or "always"
+        self.size = size
+        self.replacement = replacement
+        self.entries = [None] * size
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def lookup(self, key, draft):
+        entry = self.entries[hash(key) % self.size]
+        if entry is not None and entry[0] == key and entry[3] >= draft:
+            self.hits += 1
+            return entry[1], entry[2]
+        self.misses += 1
+        return None
+
+    def store(self, key, value, flag, draft):
+        slot = hash(key) % self.size
+        entry = self.entries[slot]
+        if (self.replacement == "depth" and entry is not None
+                and entry[0] != key and entry[3] > draft):
+            return
+        self.entries[slot] = (key, value, flag, draft)
+        self.stores += 1
+
+    def clear(self):
+        self.entries = [None] * self.size
+        self.hits = self.misses = self.stores = 0
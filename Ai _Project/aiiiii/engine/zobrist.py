@@ -0,0 +1,145 @@
+import random
+import sys
+import time
+
+from . import alphabeta, symmetry
+from .mnk import canonical_index, create_board, get_geometry
+from .transposition import TranspositionTable
+
+def random_key(rng):
+    # Signed, so keys also fit the int64 slots of lazy_smp.SharedTable
+    return rng.getrandbits(64) - (1 << 63)
+
+class ZobristHash:
+    # 64-bit board key kept up to date by make/unmake: one random number per
+    # (square, player) is XORed in when a stone is placed and out again when
+    # it is taken back, so a key costs O(1) per move instead of hashing the
+    # whole board at every node. The same seed gives the same numbers, so
+    # keys stay valid in a table that outlives one search and agree between
+    # processes.
+    def __init__(self, board, geometry, seed=0):
+        rng = random.Random(seed)
+        self.squares = [{"X": random_key(rng), "O": random_key(rng)} for _ in range(geometry.size)]
+        self.side = random_key(rng)  # XORed into node keys when "O" is to move
+        self.key = 0
+        self.empty = geometry.size
+        for i, cell in enumerate(board):
+            if cell != " ":
+                self.make(i, cell)
+
+    def make(self, i, player):
+        self.key ^= self.squares[i][player]
+        self.empty -= 1
+
+    def unmake(self, i, player):
+        self.key ^= self.squares[i][player]
+        self.empty += 1
+
+    def node_key(self, is_maximizing):
+        return self.key ^ self.side if is_maximizing else self.key
+
+class SymmetricZobristHash(ZobristHash):
+    # Keeps the keys of all 8 rotations/reflections of the board in parallel;
+    # key is the smallest of them, so symmetric positions share one key.
+    # squares[i][player] holds the 8 numbers for a stone on square i, one per
+    # transformed board, so make/unmake cost O(8) whatever the board size.
+    def __init__(self, board, geometry, seed=0):
+        rng = random.Random(seed)
+        base = [{"X": random_key(rng), "O": random_key(rng)} for _ in range(geometry.size)]
+        self.side = random_key(rng)
+        # Square i lands on square j of the board transformed by p, where p[j] == i
+        moved_to = []
+        for p in geometry.symmetries:
+            inverse = [0] * geometry.size
+            for j, i in enumerate(p):
+                inverse[i] = j
+            moved_to.append(inverse)
+        self.squares = [{player: [base[inverse[i]][player] for inverse in moved_to] for player in ("X", "O")}
+                        for i in range(geometry.size)]
+        self.keys = [0] * len(moved_to)
+        self.key = 0
+        self.empty = geometry.size
+        for i, cell in enumerate(board):
+            if cell != " ":
+                self.make(i, cell)
+
+    def make(self, i, player):
+        self.keys = [key ^ number for key, number in zip(self.keys, self.squares[i][player])]
+        self.key = min(self.keys)
+        self.empty -= 1
+
+    def unmake(self, i, player):
+        self.keys = [key ^ number for key, number in zip(self.keys, self.squares[i][player])]
+        self.key = min(self.keys)
+        self.empty += 1
+
+def string_key(board, geometry, is_maximizing):
+    return ("O" if is_maximizing else "X") + "".join(board)
+
+def canonical_key(board, geometry, is_maximizing):
+    return canonical_index(board, geometry)[0], is_maximizing
+
+def key_costs(sizes=(3, 5, 7, 10, 15), count=200, seed=0):
+    # Seconds per node to key a position by rebuilding a string and by one
+    # Zobrist make/unmake pair, plain and symmetry-aware
+    rng = random.Random(seed)
+    results = []
+    for n in sizes:
+        geometry = get_geometry(n, min(n, 5))
+        positions = []
+        for _ in range(count):
+            board = create_board(n)
+            for i in rng.sample(range(geometry.size), rng.randrange(geometry.size)):
+                board[i] = rng.choice("XO")
+            empty = [i for i in range(geometry.size) if board[i] == " "] or [0]
+            positions.append((board, rng.choice(empty)))
+        row = {"n": n}
+        for name, key in [("string", string_key), ("canonical", canonical_key)]:
+            start_time = time.perf_counter()
+            for board, _ in positions:
+                key(board, geometry, True)
+            row[name] = (time.perf_counter() - start_time) / count
+        for name, hash_class in [("zobrist", ZobristHash), ("symmetric", SymmetricZobristHash)]:
+            hashes = [hash_class(board, geometry) for board, _ in positions]
+            start_time = time.perf_counter()
+            for zobrist, (_, i) in zip(hashes, positions):
+                zobrist.make(i, "O")
+                zobrist.node_key(True)
+                zobrist.unmake(i, "O")
+            row[name] = (time.perf_counter() - start_time) / count
+        results.append(row)
+    return results
+
+def searches():
+    # Empty-board 3x3 searches with each cache key: seconds and cache size
+    geometry = get_geometry(3)
+    results = []
+    for name, search, make_cache, make_hash in [
+            ("alpha-beta string", alphabeta.find_best_move, lambda: TranspositionTable(size=8192), None),
+            ("alpha-beta zobrist", alphabeta.find_best_move, lambda: TranspositionTable(size=8192), ZobristHash),
+            ("symmetry canonical", symmetry.find_best_move, dict, None),
+            ("symmetry zobrist", symmetry.find_best_move, dict, SymmetricZobristHash)]:
+        board = create_board()
+        cache = make_cache()
+        start_time = time.perf_counter()
+        if make_hash is None:
+            move = search(board, cache)
+        else:
+            move = search(board, cache, make_hash(board, geometry))
+        seconds = time.perf_counter() - start_time
+        entries = cache.stores if isinstance(cache, TranspositionTable) else len(cache)
+        results.append((name, move, seconds, entries))
+    return results
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print("microseconds per node to key a position")
+    print(f"{'board':<8}{'string':>10}{'zobrist':>10}{'canonical':>11}{'symmetric':>11}")
+    for r in key_costs(count=count):
+        board = f"{r['n']}x{r['n']}"
+        print(f"{board:<8}{r['string'] * 1e6:>10.2f}{r['zobrist'] * 1e6:>10.2f}"
+              f"{r['canonical'] * 1e6:>11.2f}{r['symmetric'] * 1e6:>11.2f}")
+    print()
+    print(f"{'search':<20}{'move':>5}{'seconds':>9}{'entries':>8}")
+    for name, move, seconds, entries in searches():
+        print(f"{name:<20}{move:>5}{seconds:>9.3f}{entries:>8,}")
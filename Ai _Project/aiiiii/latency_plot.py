@@ -0,0 +1,64 @@
+import os
+
+# Set LATENCY_PLOT=path.png to write plots off-screen with Agg instead of opening a window
+OUTPUT = os.environ.get("LATENCY_PLOT")
+
+class LatencyPlot:
+    # One persistent figure per game. add() appends a single point with
+    # set_data and asks for a redraw; nothing is replotted from scratch and
+    # nothing blocks. The Tk canvas redraws from the window's own event loop.
+    def __init__(self, window=None, title='Step-by-Step Time Complexity', cumulative=False, label=None,
+                 output=None):
+        # matplotlib is imported here so that importing this module stays cheap
+        from matplotlib.figure import Figure
+
+        self.cumulative = cumulative
+        self.output = output if output is not None else OUTPUT
+        self.moves = []
+        self.times = []
+        self.total = 0.0
+
+        self.figure = Figure(figsize=(5, 4))
+        self.axes = self.figure.add_subplot()
+        self.line, = self.axes.plot([], [], color='blue', marker='o', linestyle='-', label=label)
+        self.axes.set_title(title)
+        self.axes.set_xlabel('Move Number')
+        self.axes.set_ylabel('Cumulative Time (seconds)' if cumulative else 'Execution Time (seconds)')
+        if label is not None:
+            self.axes.legend()
+
+        self.top = None
+        if self.output is not None or window is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            self.canvas = FigureCanvasAgg(self.figure)
+        else:
+            import tkinter as tk
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            self.top = tk.Toplevel(window)
+            self.top.title(title)
+            self.top.protocol("WM_DELETE_WINDOW", self.top.withdraw)  # hide, reset() shows it again
+            self.canvas = FigureCanvasTkAgg(self.figure, master=self.top)
+            self.canvas.get_tk_widget().pack(fill="both", expand=True)
+
+    def add(self, seconds, move=None):
+        self.total += seconds
+        self.moves.append(len(self.moves) + 1 if move is None else move)
+        self.times.append(self.total if self.cumulative else seconds)
+        self.line.set_data(self.moves, self.times)
+        self.redraw()
+
+    def reset(self):
+        # Starts a new series; the finished game stays on screen until the next add()
+        self.moves = []
+        self.times = []
+        self.total = 0.0
+        if self.top is not None:
+            self.top.deiconify()
+
+    def redraw(self):
+        self.axes.relim()
+        self.axes.autoscale_view()
+        if self.output is not None:
+            self.canvas.print_png(self.output)
+        else:
+            self.canvas.draw_idle()
@@ -1,92 +1,36 @@
-import tkinter as tk
-from tkinter import messagebox
-import time
-import matplotlib.pyplot as plt
-
-def create_board():
-    return [" " for _ in range(9)]
-
-def check_winner(board):
-    lines = [(0, 1, 2), (3, 4, 5), (6, 7, 8),
-             (0, 3, 6), (1, 4, 7), (2, 5, 8),
-             (0, 4, 8), (2, 4, 6)]
-
-    for line in lines:
-        if board[line[0]] == board[line[1]] == board[line[2]] != " ":
-            return True
-    return False
-
-def is_board_full(board):
-    return " " not in board
-
-def winning_move_or_block_opponent_heuristic(board, player):
-    lines = [(0, 1, 2), (3, 4, 5), (6, 7, 8),
-             (0, 3, 6), (1, 4, 7), (2, 5, 8),
-             (0, 4, 8), (2, 4, 6)]
-
-    score = 0
-
-    for line in lines:
-        line_values = [board[i] for i in line]
-        count_player = line_values.count(player)
-        count_opponent = line_values.count("X" if player == "O" else "O")
-
-        if count_player == 2 and count_opponent == 0:
-            # Two in a row for the player, prioritize this move
-            score += 10
-        elif count_opponent == 2 and count_player == 0:
-            # Two in a row for the opponent, prioritize blocking
-            score += 5
-
-    return score
-
-def minimax(board, depth, is_maximizing, player):
-    if check_winner(board):
-        return -1 if is_maximizing else 1
-    elif is_board_full(board):
-        return 0
-
-    scores = []
-    for i in range(9):
-        if board[i] == " ":
-            board[i] = player
-            score = minimax(board, depth + 1, not is_maximizing, "O" if player == "X" else "X")
-            board[i] = " "
-            scores.append(score)
-
-    return max(scores) if is_maximizing else min(scores)
+from engine.board import check_winner, create_board, is_board_full
+from engine.deepening import depth_limited_move
+from engine.heuristics import winning_move_or_block_evaluation
+from engine.lookup import choose_move
+from engine.mnk import SearchLimit
+from engine.minimax import find_best_move
+from engine.openingbook import load_book
+from engine.tablebase import load_tablebase
 
 move_number = 0  # Initialize move_number
 execution_times = []  # List to store execution times
 
-def make_ai_move():
-    global move_number, execution_times
-    start_time = time.time()
+def search(board, limit=None):
+    # Full minimax unless max_depth is set, then leaves at that depth are
+    # scored by the heuristic
+    if max_depth is None:
+        return find_best_move(board, limit=limit)
+    move, _ = depth_limited_move(board, max_depth, winning_move_or_block_evaluation, limit=limit)
+    return move
 
-    best_score = float('-inf')
-    best_move = None
-    for i in range(9):
-        if board[i] == " ":
-            board[i] = "O"
-            score = minimax(board, 0, False, "X")
-            board[i] = " "
-            if score > best_score:
-                best_score = score
-                best_move = i
+def make_ai_move():
+    # Search a copy of the board on a worker thread; apply_ai_move runs back on the Tk thread
+    position = list(board)
+    background.start(lambda stop: choose_move(position, search, opening_book, tablebase, SearchLimit(stop=stop)),
+                     apply_ai_move)
 
-    end_time = time.time()
-    execution_time = end_time - start_time
+def apply_ai_move(best_move, execution_time):
+    global move_number, execution_times
     execution_times.append(execution_time)
+    latency_plot.add(execution_time)
 
     move_number += 1
 
-    # Plot the execution time at each step
-    plt.plot(range(1, move_number + 1), execution_times, color='blue', marker='o', linestyle='-')
-    plt.xlabel('Move Number')
-    plt.ylabel('Execution Time (seconds)')
-    plt.title('Step-by-Step Time Complexity')
-    plt.show()
-
     if best_move is not None:
         board[best_move] = "O"
         buttons[best_move].config(text="O", state=tk.DISABLED)
@@ -99,6 +43,8 @@ def make_ai_move():
 
 def on_click(row, col):
     global move_number
+    if background.busy:
+        return
     index = 3 * row + col
     if board[index] == " ":
         board[index] = "X"
@@ -114,9 +60,11 @@ def on_click(row, col):
 
 def reset_game():
     global board, move_number, execution_times
+    background.cancel()
     board = create_board()
     move_number = 0
     execution_times = []
+    latency_plot.reset()
     for button in buttons:
         button.config(text=" ", state=tk.NORMAL)
 
@@ -124,7 +72,18 @@ def run():
     window.mainloop()
 
 if __name__ == "__main__":
+    # GUI modules are only imported when the front-end starts
+    import tkinter as tk
+    from tkinter import messagebox
+    from background import BackgroundSearch
+    from latency_plot import LatencyPlot
+
     board = create_board()
+    max_depth = None  # e.g. 3 to trade accuracy for speed, see python -m engine.heuristics
+    # The opening book and the tablebase play perfectly, so both are left out
+    # when max_depth asks for the heuristic
+    opening_book = load_book() if max_depth is None else None  # generate with: python -m engine.openingbook
+    tablebase = load_tablebase() if max_depth is None else None  # generate with: python -m engine.tablebase (needs NumPy)
 
     window = tk.Tk()
     window.title("Tic Tac Toe")
@@ -143,4 +102,8 @@ if __name__ == "__main__":
    # Create a reset button
     reset_button = tk.Button(window, text="Reset",bg="#f5f5f5", command=reset_game)
     reset_button.grid(row=3, columnspan=3, pady=10)
+    thinking_label = tk.Label(window, text="")
+    thinking_label.grid(row=4, columnspan=3)
+    background = BackgroundSearch(window, thinking_label)
+    latency_plot = LatencyPlot(window)
     run()
@@ -0,0 +1,52 @@
+import sys
+import time
+
+from engine import mnk
+
+# (n, k) board sizes, smallest first
+SIZES = [(3, 3), (4, 4), (5, 4), (7, 5)]
+
+def run_minimax(board, geometry, limit):
+    return mnk.best_move(board, geometry, use_alpha_beta=False, limit=limit)
+
+def run_alpha_beta(board, geometry, limit):
+    return mnk.best_move(board, geometry, use_alpha_beta=True, limit=limit)
+
+STRATEGIES = [
+    ("minimax", run_minimax),
+    ("alpha-beta", run_alpha_beta),
+]
+
+def run(seconds=5.0, sizes=SIZES, strategies=STRATEGIES):
+    # Searches the empty board once per strategy and size within a time budget
+    results = []
+    for name, search in strategies:
+        for n, k in sizes:
+            geometry = mnk.get_geometry(n, k)
+            board = mnk.create_board(n)
+            limit = mnk.SearchLimit(seconds=seconds)
+            start_time = time.perf_counter()
+            try:
+                move, score = search(board, geometry, limit)
+                finished = True
+            except mnk.SearchAborted:
+                move, score = None, None
+                finished = False
+            elapsed = time.perf_counter() - start_time
+            results.append({"strategy": name, "n": n, "k": k, "finished": finished,
+                            "move": move, "score": score, "nodes": limit.nodes,
+                            "seconds": elapsed, "nodes_per_sec": limit.nodes / elapsed})
+    return results
+
+def print_results(results):
+    print(f"{'strategy':<14}{'board':<10}{'status':<10}{'move':>6}{'nodes':>12}{'seconds':>10}{'nodes/sec':>12}")
+    for r in results:
+        status = "solved" if r["finished"] else "timeout"
+        board = f"{r['n']}x{r['n']} k={r['k']}"
+        move = "-" if r["move"] is None else r["move"]
+        print(f"{r['strategy']:<14}{board:<10}{status:<10}{move:>6}{r['nodes']:>12,}"
+              f"{r['seconds']:>10.2f}{r['nodes_per_sec']:>12,.0f}")
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    print_results(run(seconds))
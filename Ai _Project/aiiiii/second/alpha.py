@@ -1,73 +1,27 @@
-import tkinter as tk
-from tkinter import messagebox
-import time
-import matplotlib.pyplot as plt
-
-def create_board():
-    return [" " for _ in range(9)]
-
-def check_winner(board):
-    lines = [(0, 1, 2), (3, 4, 5), (6, 7, 8),
-             (0, 3, 6), (1, 4, 7), (2, 5, 8),
-             (0, 4, 8), (2, 4, 6)]
-
-    for line in lines:
-        if board[line[0]] == board[line[1]] == board[line[2]] != " ":
-            return True
-    return False
-
-def is_board_full(board):
-    return " " not in board
-
-def alpha_beta_pruning(board, depth, alpha, beta, is_maximizing):
-    if check_winner(board):
-        return -1 if is_maximizing else 1
-    elif is_board_full(board):
-        return 0
-
-    if is_maximizing:
-        max_eval = float('-inf')
-        for i in range(9):
-            if board[i] == " ":
-                board[i] = "O"
-                eval_score = alpha_beta_pruning(board, depth + 1, alpha, beta, False)
-                board[i] = " "
-                max_eval = max(max_eval, eval_score)
-                alpha = max(alpha, eval_score)
-                if beta <= alpha:
-                    break
-        return max_eval
-    else:
-        min_eval = float('inf')
-        for i in range(9):
-            if board[i] == " ":
-                board[i] = "X"
-                eval_score = alpha_beta_pruning(board, depth + 1, alpha, beta, True)
-                board[i] = " "
-                min_eval = min(min_eval, eval_score)
-                beta = min(beta, eval_score)
-                if beta <= alpha:
-                    break
-        return min_eval
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from engine.alphabeta import find_best_move
+from engine.board import check_winner, create_board, is_board_full
+from engine.lookup import choose_move
+from engine.mnk import SearchLimit, get_geometry
+from engine.openingbook import load_book
+from engine.transposition import TranspositionTable
+from engine.zobrist import ZobristHash
+
+def search(board, limit=None):
+    return find_best_move(board, transposition_table, ZobristHash(board, get_geometry(3)), limit=limit)
 
 def make_ai_move():
-    start_time = time.time()
-    
-    best_score = float('-inf')
-    best_move = None
-
-    for i in range(9):
-        if board[i] == " ":
-            board[i] = "O"
-            score = alpha_beta_pruning(board, 0, float('-inf'), float('inf'), False)
-            board[i] = " "
-            if score > best_score:
-                best_score = score
-                best_move = i
-
-    end_time = time.time()
-    execution_time = end_time - start_time
+    # Search a copy of the board on a worker thread; apply_ai_move runs back on the Tk thread
+    position = list(board)
+    background.start(lambda stop: choose_move(position, search, opening_book, limit=SearchLimit(stop=stop)),
+                     apply_ai_move)
+
+def apply_ai_move(best_move, execution_time):
     execution_times.append(execution_time)
+    latency_plot.add(execution_time)
 
     if best_move is not None:
         board[best_move] = "O"
@@ -80,6 +34,8 @@ def make_ai_move():
             reset_game()
 
 def on_click(row, col):
+    if background.busy:
+        return
     index = 3 * row + col
     if board[index] == " ":
         board[index] = "X"
@@ -92,34 +48,35 @@ def on_click(row, col):
         else:
             messagebox.showinfo("Tic Tac Toe", "It's a draw!")
             reset_game()
-            plot_graph()
 
 def reset_game():
     global board, execution_times
+    background.cancel()
     board = create_board()
     execution_times = []
+    latency_plot.reset()
     for button in buttons:
         button.config(text=" ", state=tk.NORMAL)
 
 def reset_game_button():
     reset_game()
 
-def plot_graph():
-    cumulative_time = [sum(execution_times[:i + 1]) for i in range(len(execution_times))]
-    plt.plot(range(1, len(cumulative_time) + 1), cumulative_time, marker='o')
-    plt.title('Cumulative Time Complexity Analysis')
-    plt.xlabel('Move Number')
-    plt.ylabel('Cumulative Time (seconds)')
-    plt.show()
-
 def run():
     window.after(100, make_ai_move)  # Use after to schedule the first AI move after a short delay
     window.mainloop()
 
 
 if __name__ == "__main__":
+    # GUI modules are only imported when the front-end starts
+    import tkinter as tk
+    from tkinter import messagebox
+    from background import BackgroundSearch
+    from latency_plot import LatencyPlot
+
     board = create_board()
+    opening_book = load_book()  # generate with: python -m engine.openingbook
     execution_times = []
+    transposition_table = TranspositionTable(size=8192, replacement="depth")
 
     window = tk.Tk()
     window.title("Tic Tac Toe")
@@ -137,5 +94,9 @@ if __name__ == "__main__":
 
     reset_button = tk.Button(window, text="Reset", command=reset_game_button)
     reset_button.grid(row=3, columnspan=3, pady=10)
+    thinking_label = tk.Label(window, text="")
+    thinking_label.grid(row=4, columnspan=3)
+    background = BackgroundSearch(window, thinking_label)
+    latency_plot = LatencyPlot(window, 'Cumulative Time Complexity Analysis', cumulative=True)
 
     run()
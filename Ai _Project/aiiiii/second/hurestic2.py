@@ -1,7 +1,11 @@
-import tkinter as tk
-from tkinter import messagebox
 import time
-import matplotlib.pyplot as plt
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from engine.instrumentation import SearchMetrics
+from engine.minimax import minimax_with_move
+from engine.mnk import SearchLimit
 
 class TicTacToe:
     def __init__(self):
@@ -10,6 +14,7 @@ class TicTacToe:
         self.board = [" " for _ in range(9)]  # 3x3 board represented as a list
         self.current_player = "X"
         self.move_number = 0
+        self.search_metrics = SearchMetrics("minimax")  # counters of the last AI search
 
         self.buttons = []
         for i in range(3):
@@ -30,8 +35,14 @@ class TicTacToe:
         # Create a reset button
         self.reset_button = tk.Button(self.window, text="Reset", command=self.reset_game)
         self.reset_button.grid(row=3, columnspan=3, pady=10)
+        self.thinking_label = tk.Label(self.window, text="")
+        self.thinking_label.grid(row=4, columnspan=3)
+        self.background = BackgroundSearch(self.window, self.thinking_label)
+        self.latency_plot = LatencyPlot(self.window, 'Time Complexity', label='Player X')
 
     def on_click(self, row, col):
+        if self.background.busy:
+            return
         start_time = time.time()
 
         index = 3 * row + col
@@ -47,13 +58,16 @@ class TicTacToe:
             else:
                 self.switch_player()
                 self.make_ai_move()
+                return  # apply_ai_move records the time of the AI move
 
         end_time = time.time()
-        execution_time = end_time - start_time
+        self.record_move_time(end_time - start_time)
 
+    def record_move_time(self, execution_time):
         if self.current_player == "X":
             self.move_numbers_X.append(self.move_number)
             self.execution_times_X.append(execution_time)
+            self.latency_plot.add(execution_time, self.move_number)
         else:
             self.move_numbers_O.append(self.move_number)
             self.execution_times_O.append(execution_time)
@@ -73,20 +87,15 @@ class TicTacToe:
         self.move_number += 1
 
     def make_ai_move(self):
-        # Basic AI using a minimax algorithm
-        _, node_count = self.minimax(self.board, 0, True)
-        print("Nodes explored by AI:", node_count)
-
-        best_score = float('-inf')
-        best_move = None
-        for i in range(9):
-            if self.board[i] == " ":
-                self.board[i] = "O"
-                score, _ = self.minimax(self.board, 0, False)
-                self.board[i] = " "
-                if score > best_score:
-                    best_score = score
-                    best_move = i
+        # Basic AI using a minimax algorithm, run on a copy of the board on a
+        # worker thread; apply_ai_move runs back on the Tk thread
+        position = list(self.board)
+        metrics = self.search_metrics = SearchMetrics("minimax")
+        self.background.start(lambda stop: minimax_with_move(position, 0, True, metrics, SearchLimit(stop=stop)),
+                              self.apply_ai_move)
+
+    def apply_ai_move(self, result, execution_time):
+        best_score, best_move = result
 
         if best_move is not None:
             self.board[best_move] = "O"
@@ -99,63 +108,25 @@ class TicTacToe:
                 self.reset_game()
             else:
                 self.switch_player()
-    def heuristic_evaluation(self):
-        if self.check_winner():
-            return 1
-        elif self.check_winner(player="O"):
-            return -1
-        else:
-            return 0           
-
-    def minimax(self, board, depth, is_maximizing):
-        if self.check_winner():
-            return -1 if is_maximizing else 1, 1
-        elif " " not in board:
-            return 0, 1
-
-        node_count = 1  # Count the current node
-
-        if is_maximizing:
-            max_eval = float('-inf')
-            for i in range(9):
-                if board[i] == " ":
-                    board[i] = "O"
-                    eval, count = self.minimax(board, depth + 1, False)
-                    node_count += count
-                    board[i] = " "
-                    max_eval = max(max_eval, eval)
-            return max_eval, node_count
-        else:
-            min_eval = float('inf')
-            for i in range(9):
-                if board[i] == " ":
-                    board[i] = "X"
-                    eval, count = self.minimax(board, depth + 1, True)
-                    node_count += count
-                    board[i] = " "
-                    min_eval = min(min_eval, eval)
-            return min_eval, node_count
+        self.record_move_time(execution_time)
 
     def reset_game(self):
+        self.background.cancel()
         self.board = [" " for _ in range(9)]
         for button in self.buttons:
             button.config(text=" ")
         self.current_player = "X"
         self.move_number = 0
-        self.plot_execution_times()
-
-    def plot_execution_times(self):
-        # Plot the execution times for both players
-        plt.plot(self.move_numbers_X, self.execution_times_X, label='Player X', color='blue', marker='o', linestyle='-')
-       
-        plt.ylabel('Execution Time (seconds)')
-        plt.title('Time Complexity')
-        plt.legend()
-        plt.show()
 
     def run(self):
         self.window.mainloop()
 
 if __name__ == "__main__":
+    # GUI modules are only imported when the front-end starts
+    import tkinter as tk
+    from tkinter import messagebox
+    from background import BackgroundSearch
+    from latency_plot import LatencyPlot
+
     game = TicTacToe()
     game.run()
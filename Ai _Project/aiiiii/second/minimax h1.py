@@ -1,66 +1,37 @@
-import tkinter as tk
-from tkinter import messagebox
-import time
-import matplotlib.pyplot as plt
-
-def create_board():
-    return [" " for _ in range(9)]
-
-def check_winner(board):
-    lines = [(0, 1, 2), (3, 4, 5), (6, 7, 8),
-             (0, 3, 6), (1, 4, 7), (2, 5, 8),
-             (0, 4, 8), (2, 4, 6)]
-
-    for line in lines:
-        if board[line[0]] == board[line[1]] == board[line[2]] != " ":
-            return True
-    return False
-
-def is_board_full(board):
-    return " " not in board
-
-def center_occupancy_heuristic(board, player):
-    center_index = 4
-    center_score = 2 if board[center_index] == player else 0
-    return center_score
-
-def minimax(board, depth, is_maximizing, player):
-    if check_winner(board):
-        return -1 if is_maximizing else 1
-    elif is_board_full(board):
-        return 0
-
-    scores = []
-    for i in range(9):
-        if board[i] == " ":
-            board[i] = player
-            score = minimax(board, depth + 1, not is_maximizing, "O" if player == "X" else "X")
-            board[i] = " "
-            scores.append(score)
-
-    return max(scores) if is_maximizing else min(scores)
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from engine.board import check_winner, create_board, is_board_full
+from engine.deepening import depth_limited_move
+from engine.heuristics import center_occupancy_evaluation
+from engine.lookup import choose_move
+from engine.mnk import SearchLimit
+from engine.minimax import find_best_move
+from engine.openingbook import load_book
+from engine.tablebase import load_tablebase
 
 move_number = 0  # Initialize move_number
 execution_times = []  # List to store execution times
 
+def search(board, limit=None):
+    # Full minimax unless max_depth is set, then leaves at that depth are
+    # scored by the heuristic
+    if max_depth is None:
+        return find_best_move(board, limit=limit)
+    move, _ = depth_limited_move(board, max_depth, center_occupancy_evaluation, limit=limit)
+    return move
+
 def make_ai_move():
+    # Search a copy of the board on a worker thread; apply_ai_move runs back on the Tk thread
+    position = list(board)
+    background.start(lambda stop: choose_move(position, search, opening_book, tablebase, SearchLimit(stop=stop)),
+                     apply_ai_move)
+
+def apply_ai_move(best_move, execution_time):
     global move_number, execution_times
-    start_time = time.time()
-
-    best_score = float('-inf')
-    best_move = None
-    for i in range(9):
-        if board[i] == " ":
-            board[i] = "O"
-            score = minimax(board, 0, False, "X")
-            board[i] = " "
-            if score > best_score:
-                best_score = score
-                best_move = i
-
-    end_time = time.time()
-    execution_time = end_time - start_time
     execution_times.append(execution_time)
+    latency_plot.add(execution_time)
 
     move_number += 1
 
@@ -69,47 +40,51 @@ def make_ai_move():
         buttons[best_move].config(text="O", state=tk.DISABLED)
         if check_winner(board):
             messagebox.showinfo("Tic Tac Toe", "O wins!")
-            show_plots()
 
         elif is_board_full(board):
             messagebox.showinfo("Tic Tac Toe", "It's a draw!")
-            show_plots()
 
 def on_click(row, col):
     global move_number
+    if background.busy:
+        return
     index = 3 * row + col
     if board[index] == " ":
         board[index] = "X"
         buttons[index].config(text="X", state=tk.DISABLED)
         if check_winner(board):
             messagebox.showinfo("Tic Tac Toe", "X wins!")
-            show_plots()
         elif not is_board_full(board):
             make_ai_move()
         else:
             messagebox.showinfo("Tic Tac Toe", "It's a draw!")
-            show_plots()
 
 def reset_game():
     global board, move_number, execution_times
+    background.cancel()
     board = create_board()
     move_number = 0
     execution_times = []
+    latency_plot.reset()
     for button in buttons:
         button.config(text=" ", state=tk.NORMAL)
 
-def show_plots():
-    plt.plot(range(1, move_number + 1), execution_times, color='blue', marker='o', linestyle='-')
-    plt.xlabel('Move Number')
-    plt.ylabel('Execution Time (seconds)')
-    plt.title('Cumulative Time Complexity Analysis')
-    plt.show()
-
 def run():
     window.mainloop()
 
 if __name__ == "__main__":
+    # GUI modules are only imported when the front-end starts
+    import tkinter as tk
+    from tkinter import messagebox
+    from background import BackgroundSearch
+    from latency_plot import LatencyPlot
+
     board = create_board()
+    max_depth = None  # e.g. 3 to trade accuracy for speed, see python -m engine.heuristics
+    # The opening book and the tablebase play perfectly, so both are left out
+    # when max_depth asks for the heuristic
+    opening_book = load_book() if max_depth is None else None  # generate with: python -m engine.openingbook
+    tablebase = load_tablebase() if max_depth is None else None  # generate with: python -m engine.tablebase (needs NumPy)
 
     window = tk.Tk()
     window.title("Tic Tac Toe")
@@ -129,5 +104,9 @@ if __name__ == "__main__":
     # Create a reset button
     reset_button = tk.Button(window, text="Reset", bg="#f5f5f5", command=reset_game)
     reset_button.grid(row=3, columnspan=3, pady=10)
+    thinking_label = tk.Label(window, text="")
+    thinking_label.grid(row=4, columnspan=3)
+    background = BackgroundSearch(window, thinking_label)
+    latency_plot = LatencyPlot(window, 'Cumulative Time Complexity Analysis')
 
     run()
@@ -1,16 +1,22 @@
-import tkinter as tk
-from tkinter import messagebox
-import random
 import time
-import matplotlib.pyplot as plt
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from engine.blocking import medium_move
+from engine.mcts import mcts, tactical_rollout
+from engine.mnk import SearchLimit, get_geometry
 
 class TicTacToe:
-    def __init__(self):
+    def __init__(self, use_mcts=False, playouts=2000, seconds=None):
         self.window = tk.Tk()
         self.window.title("Tic Tac Toe")
         self.board = [" " for _ in range(9)]  # 3x3 board represented as a list
         self.current_player = "X"
         self.execution_times = []  # List to store execution times
+        self.use_mcts = use_mcts
+        self.playouts = playouts  # MCTS budget, whichever of playouts and seconds runs out first
+        self.seconds = seconds
 
         self.buttons = []
         for i in range(3):
@@ -26,8 +32,14 @@ class TicTacToe:
         # Create a reset button
         reset_button = tk.Button(self.window, text="Reset", command=self.reset_game, bg="#f5f5f5")
         reset_button.grid(row=3, column=1, pady=10)    
+        self.thinking_label = tk.Label(self.window, text="")
+        self.thinking_label.grid(row=4, columnspan=3)
+        self.background = BackgroundSearch(self.window, self.thinking_label)
+        self.latency_plot = LatencyPlot(self.window, 'Cumulative Time Complexity Analysis', cumulative=True)
 
     def on_click(self, row, col):
+        if self.background.busy:
+            return
         start_time = time.time()
 
         index = 3 * row + col
@@ -41,10 +53,14 @@ class TicTacToe:
             else:
                 self.switch_player()
                 self.make_ai_move()
+                return  # apply_ai_move records the time of the AI move
 
         end_time = time.time()
-        execution_time = end_time - start_time
+        self.record_move_time(end_time - start_time)
+
+    def record_move_time(self, execution_time):
         self.execution_times.append(execution_time)
+        self.latency_plot.add(execution_time)
 
     def check_winner(self):
         lines = [(0, 1, 2), (3, 4, 5), (6, 7, 8),
@@ -60,16 +76,21 @@ class TicTacToe:
         self.current_player = "O" if self.current_player == "X" else "X"
 
     def make_ai_move(self):
-        # Medium-level AI: Combining random moves and strategic blocking
-        available_spots = [i for i in range(9) if self.board[i] == " "]
-        if available_spots:
-            # Random move with 60% probability
-            if random.random() < 0.6:
-                ai_move = random.choice(available_spots)
-            else:
-                # Strategic blocking move
-                ai_move = self.strategic_blocking()
+        # Medium-level AI: Combining random moves and strategic blocking,
+        # or MCTS with tactical rollouts when use_mcts is set. Either runs on
+        # a copy of the board on a worker thread; apply_ai_move runs back on
+        # the Tk thread
+        position = list(self.board)
+        if self.use_mcts:
+            search = lambda stop: mcts(position, get_geometry(3),
+                                       SearchLimit(nodes=self.playouts, seconds=self.seconds, stop=stop),
+                                       rollout=tactical_rollout)[0]
+        else:
+            search = lambda stop: medium_move(position)
+        self.background.start(search, self.apply_ai_move)
 
+    def apply_ai_move(self, ai_move, execution_time):
+        if ai_move is not None:
             self.board[ai_move] = "O"
             self.buttons[ai_move].config(text="O")
             if self.check_winner():
@@ -78,19 +99,7 @@ class TicTacToe:
                 self.show_result(draw=True)
             else:
                 self.switch_player()
-
-    def strategic_blocking(self):
-        # Check if there's a move to block the player from winning
-        for i in range(9):
-            if self.board[i] == " ":
-                self.board[i] = "X"
-                if self.check_winner():
-                    self.board[i] = " "
-                    return i
-                self.board[i] = " "
-
-        # If no blocking move, return a random move
-        return random.choice([i for i in range(9) if self.board[i] == " "])
+        self.record_move_time(execution_time)
 
     def show_result(self, draw=False):
         if draw:
@@ -99,27 +108,26 @@ class TicTacToe:
             winner = self.current_player
             messagebox.showinfo("Tic Tac Toe", f"{winner} wins!")
 
-        self.plot_time_complexity()
         self.reset_game()
 
-    def plot_time_complexity(self):
-        cumulative_time = [sum(self.execution_times[:i + 1]) for i in range(len(self.execution_times))]
-        plt.plot(range(1, len(cumulative_time) + 1), cumulative_time, marker='o')
-        plt.title('Cumulative Time Complexity Analysis')
-        plt.xlabel('Move Number')
-        plt.ylabel('Cumulative Time (seconds)')
-        plt.show()
-
     def reset_game(self):
+        self.background.cancel()
         self.board = [" " for _ in range(9)]
         for button in self.buttons:
             button.config(text=" ")
         self.current_player = "X"
         self.execution_times = []
+        self.latency_plot.reset()
 
     def run(self):
         self.window.mainloop()
 
 if __name__ == "__main__":
-    game = TicTacToe()
+    # GUI modules are only imported when the front-end starts
+    import tkinter as tk
+    from tkinter import messagebox
+    from background import BackgroundSearch
+    from latency_plot import LatencyPlot
+
+    game = TicTacToe(use_mcts=False)  # True for MCTS, see python -m engine.mcts
     game.run()
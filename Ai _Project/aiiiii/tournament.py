@@ -0,0 +1,145 @@
+import itertools
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from engine import alphabeta, minimax, mnk
+from engine.blocking import medium_move
+from engine.deepening import depth_limited_move
+from engine.heuristics import center_occupancy_evaluation, winning_move_or_block_evaluation
+from engine.transposition import TranspositionTable
+
+GEOMETRY = mnk.get_geometry(3)
+HEURISTIC_DEPTH = 3  # max_depth of the heuristic engines, see python -m engine.heuristics
+
+def flip(board):
+    # Swap X and O so an engine written for "O" can play "X"
+    return ["O" if cell == "X" else "X" if cell == "O" else " " for cell in board]
+
+class SearchEngine:
+    # Deterministic engine searching for "O" with search(board) -> square;
+    # results are cached per position, only cache misses are timed as search latency
+    def __init__(self, search):
+        self.search = search
+        self.cache = {}
+
+    def choose(self, board, rng):
+        key = "".join(board)
+        if key not in self.cache:
+            start_time = time.perf_counter()
+            self.cache[key] = self.search(board)
+            return self.cache[key], time.perf_counter() - start_time
+        return self.cache[key], None
+
+class RandomBlockingEngine:
+    # Medium-level AI from second/symetric2.py: random moves and strategic blocking
+    def choose(self, board, rng):
+        start_time = time.perf_counter()
+        move = medium_move(board, rng)
+        return move, time.perf_counter() - start_time
+
+def alpha_beta_engine():
+    # One transposition table per worker process, kept across games like alpha.py keeps it across moves
+    table = TranspositionTable()
+    return SearchEngine(lambda board: alphabeta.find_best_move(board, table))
+
+def heuristic_engine(evaluate):
+    # The heuristic scripts with max_depth set: leaves at HEURISTIC_DEPTH are scored by evaluate
+    return SearchEngine(lambda board: depth_limited_move(board, HEURISTIC_DEPTH, evaluate)[0])
+
+ENGINES = {
+    "minimax": lambda: SearchEngine(minimax.find_best_move),
+    "center occupancy": lambda: heuristic_engine(center_occupancy_evaluation),
+    "win/block": lambda: heuristic_engine(winning_move_or_block_evaluation),
+    "alpha-beta": alpha_beta_engine,
+    "random/blocking": lambda: RandomBlockingEngine(),
+}
+
+engines = {}  # per worker process, so search caches survive across matches
+
+def get_engine(name):
+    if name not in engines:
+        engines[name] = ENGINES[name]()
+    return engines[name]
+
+def play_game(players, rng, latencies):
+    # players maps "X"/"O" to engine names, X moves first; returns the winner or None
+    board = mnk.create_board(3)
+    player = "X"
+    while True:
+        view = board if player == "O" else flip(board)
+        move, latency = get_engine(players[player]).choose(view, rng)
+        if latency is not None:
+            latencies[players[player]].append(latency)
+        board[move] = player
+        if mnk.check_winner(board, GEOMETRY):
+            return player
+        if mnk.is_board_full(board):
+            return None
+        player = "O" if player == "X" else "X"
+
+def play_match(name_a, name_b, games, seed):
+    rng = random.Random(seed)
+    result = {"wins": 0, "draws": 0, "losses": 0}
+    latencies = {name_a: [], name_b: []}
+    for game in range(games):
+        # Alternate who moves first
+        a_side = "X" if game % 2 == 0 else "O"
+        b_side = "O" if a_side == "X" else "X"
+        winner = play_game({a_side: name_a, b_side: name_b}, rng, latencies)
+        if winner is None:
+            result["draws"] += 1
+        elif winner == a_side:
+            result["wins"] += 1
+        else:
+            result["losses"] += 1
+    return name_a, name_b, result, latencies
+
+def run_tournament(games=1000, workers=None, chunk=250, seed=0):
+    names = list(ENGINES)
+    tasks = []
+    for name_a, name_b in itertools.combinations(names, 2):
+        for start in range(0, games, chunk):
+            tasks.append((name_a, name_b, min(chunk, games - start), seed + len(tasks)))
+
+    table = {(a, b): {"wins": 0, "draws": 0, "losses": 0} for a in names for b in names if a != b}
+    latencies = {name: [] for name in names}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for name_a, name_b, result, times in pool.map(play_match, *zip(*tasks)):
+            for key in result:
+                table[(name_a, name_b)][key] += result[key]
+            table[(name_b, name_a)]["wins"] += result["losses"]
+            table[(name_b, name_a)]["draws"] += result["draws"]
+            table[(name_b, name_a)]["losses"] += result["wins"]
+            for name in times:
+                latencies[name].extend(times[name])
+    return table, latencies
+
+def print_results(table, latencies):
+    names = list(ENGINES)
+    width = max(len(name) for name in names) + 2
+    print("W/D/L of the row engine against the column engine")
+    print(" " * width + "".join(f"{name:>{width + 4}}" for name in names))
+    for a in names:
+        cells = []
+        for b in names:
+            r = table.get((a, b))
+            cells.append("-" if r is None else f"{r['wins']}/{r['draws']}/{r['losses']}")
+        print(f"{a:<{width}}" + "".join(f"{cell:>{width + 4}}" for cell in cells))
+
+    print()
+    print(f"{'engine':<{width}}{'searches':>10}{'mean ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for name in names:
+        times = sorted(latencies[name])
+        if not times:
+            continue
+        p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+        print(f"{name:<{width}}{len(times):>10}{1000 * sum(times) / len(times):>10.3f}"
+              f"{1000 * p95:>10.3f}{1000 * times[-1]:>10.3f}")
+
+if __name__ == "__main__":
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    print_results(*run_tournament(games, workers))
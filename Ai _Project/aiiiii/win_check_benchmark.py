@@ -0,0 +1,73 @@
+import random
+import sys
+import time
+
+from engine import mnk
+
+# (n, k) board sizes, smallest first
+SIZES = [(3, 3), (5, 4), (7, 5), (10, 5), (15, 5)]
+
+def random_positions(geometry, count, rng):
+    # (board, last move) pairs from random games that nobody has won yet
+    positions = []
+    while len(positions) < count:
+        board = mnk.create_board(geometry.n)
+        empty = list(range(geometry.size))
+        rng.shuffle(empty)
+        player = "X"
+        for i in empty[:rng.randrange(1, geometry.size)]:
+            if mnk.make_move(board, i, player, geometry):
+                board[i] = " "
+                break
+            last_move = i
+            player = "O" if player == "X" else "X"
+        else:
+            positions.append((board, last_move))
+    return positions
+
+def time_checks(positions, check, repeat):
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for board, last_move in positions:
+            check(board, last_move)
+    return (time.perf_counter() - start_time) / (repeat * len(positions))
+
+def win_checks(sizes=SIZES, count=200, repeat=20, seed=0):
+    # Seconds per call of the full scan and of the last-move check on the same positions
+    rng = random.Random(seed)
+    results = []
+    for n, k in sizes:
+        geometry = mnk.get_geometry(n, k)
+        positions = random_positions(geometry, count, rng)
+        full = time_checks(positions, lambda board, _: mnk.check_winner(board, geometry), repeat)
+        last = time_checks(positions, lambda board, i: mnk.completes_line(board, i, geometry), repeat)
+        results.append({"n": n, "k": k, "lines": len(geometry.lines), "full": full, "last_move": last})
+    return results
+
+def searches(sizes=((3, 3), (4, 3))):
+    # Full alpha-beta from the empty board with each winner check
+    results = []
+    for n, k in sizes:
+        geometry = mnk.get_geometry(n, k)
+        row = {"n": n, "k": k}
+        for name, search in [("full", mnk.alpha_beta_pruning), ("last_move", mnk.alpha_beta_last_move)]:
+            limit = mnk.SearchLimit()
+            start_time = time.perf_counter()
+            row["score"] = search(mnk.create_board(n), 0, float('-inf'), float('inf'), True, geometry, limit)
+            row[name] = time.perf_counter() - start_time
+            row["nodes"] = limit.nodes
+        results.append(row)
+    return results
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"{'board':<12}{'lines':>6}{'full scan ns':>14}{'last move ns':>14}{'speedup':>9}")
+    for r in win_checks(repeat=repeat):
+        board = f"{r['n']}x{r['n']} k={r['k']}"
+        print(f"{board:<12}{r['lines']:>6}{r['full'] * 1e9:>14,.0f}{r['last_move'] * 1e9:>14,.0f}"
+              f"{r['full'] / r['last_move']:>8.1f}x")
+    print()
+    print(f"{'search':<12}{'nodes':>10}{'full scan s':>13}{'last move s':>13}{'speedup':>9}")
+    for r in searches():
+        board = f"{r['n']}x{r['n']} k={r['k']}"
+        print(f"{board:<12}{r['nodes']:>10,}{r['full']:>13.3f}{r['last_move']:>13.3f}{r['full'] / r['last_move']:>8.1f}x")